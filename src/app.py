@@ -1,7 +1,18 @@
 import logging
+import os
 from dependency_injector import containers, providers
 from dependency_injector.wiring import Provide, inject
+from monitoring.render_tracer import RenderTracer
+from repository.fault_injecting_backend import FaultInjectingBackend
+from repository.local_open_data_backend import LocalOpenDataBackend
+from repository.parquet_store import ParquetStore
+from repository.resilient_backend import ResilientStatsBombBackend
+from repository.statsbomb_api_backend import StatsBombApiBackend
 from repository.statsbomb_repository import StatsBombRepository
+from repository.synthetic_open_data_backend import SyntheticOpenDataBackend
+from service.match_event_store import MatchEventStore
+from service.match_prefetch_service import MatchPrefetchService
+from service.pitch_render_pool import PitchRenderPool
 from service.session_state_service import SessionStateService
 from view.abstract_streamlit_view import AbstractStreamlitView
 from view.international_competitions_view import InternationalCompetitionsView
@@ -10,10 +21,70 @@ from view.home_view import HomeView
 from view.main_view import MainView
 from view.sidebar_view import SidebarView
 from view.word_cups_view import WordCupsView
+import streamlit as st
 
 
 class Container(containers.DeclarativeContainer):      
-    statsbomb_repository = providers.Singleton(StatsBombRepository)
+    config = providers.Configuration()
+    
+    synthetic_backend = providers.Singleton(
+        SyntheticOpenDataBackend,
+        n_matches=config.synthetic_matches,
+        events_per_match=config.synthetic_events_per_match
+    )
+    
+    statsbomb_source = providers.Selector(
+        config.statsbomb_backend,
+        api=providers.Singleton(StatsBombApiBackend),
+        local=providers.Singleton(
+            LocalOpenDataBackend,
+            data_dir=config.open_data_dir
+        ),
+        synthetic=synthetic_backend,
+        faulty=providers.Singleton(
+            FaultInjectingBackend,
+            backend=synthetic_backend,
+            latency=config.fault_latency,
+            error_rate=config.fault_error_rate,
+            hang_rate=config.fault_hang_rate
+        )
+    )
+    
+    statsbomb_backend = providers.Singleton(
+        ResilientStatsBombBackend,
+        backend=statsbomb_source,
+        timeout=config.fetch_timeout,
+        retries=config.fetch_retries
+    )
+    
+    parquet_store = providers.Singleton(
+        ParquetStore,
+        base_dir=config.cache_dir,
+        competitions_ttl=config.competitions_ttl
+    )
+    
+    statsbomb_repository = providers.Singleton(
+        StatsBombRepository,
+        statsbomb_backend=statsbomb_backend,
+        parquet_store=parquet_store,
+        competitions_ttl=config.competitions_ttl
+    )
+    
+    match_prefetch_service = providers.Singleton(
+        MatchPrefetchService,
+        statsbomb_repository=statsbomb_repository
+    )
+    
+    match_event_store = providers.Singleton(
+        MatchEventStore,
+        match_prefetch_service=match_prefetch_service,
+        max_bytes=config.event_store_max_bytes
+    )
+    
+    pitch_render_pool = providers.Singleton(
+        PitchRenderPool,
+        max_workers=config.pitch_render_workers
+    )
     
     view_strategy_list = providers.List(   
         providers.Singleton(HomeView),
@@ -23,7 +94,10 @@ class Container(containers.DeclarativeContainer):
             session_state_service=providers.Factory(
                 SessionStateService,
                 states_prefix='world_cups_view'
-            )
+            ),
+            match_prefetch_service=match_prefetch_service,
+            match_event_store=match_event_store,
+            pitch_render_pool=pitch_render_pool
         ),
         providers.Singleton(
             NationalCompetitionsView,
@@ -31,7 +105,10 @@ class Container(containers.DeclarativeContainer):
             session_state_service=providers.Factory(
                 SessionStateService,
                 states_prefix='national_competitions_view'
-            )
+            ),
+            match_prefetch_service=match_prefetch_service,
+            match_event_store=match_event_store,
+            pitch_render_pool=pitch_render_pool
         ),
         providers.Singleton(
             InternationalCompetitionsView,
@@ -39,7 +116,10 @@ class Container(containers.DeclarativeContainer):
             session_state_service=providers.Factory(
                 SessionStateService,
                 states_prefix='international_competitions_view'
-            ) 
+            ),
+            match_prefetch_service=match_prefetch_service,
+            match_event_store=match_event_store,
+            pitch_render_pool=pitch_render_pool
         )           
     )
     
@@ -49,8 +129,34 @@ class Container(containers.DeclarativeContainer):
         view_strategy_list=view_strategy_list
     )
 
+# Streamlit reruns this script on every interaction, the container (and the
+# caches and thread pools its singletons hold) has to outlive the reruns. The
+# Container class is redefined on each rerun, so main() is wired by name.
+# No spinner: it would be drawn before st.set_page_config on the first run
+@st.cache_resource(show_spinner=False)
+def create_container() -> Container:
+    container = Container()
+    container.config.statsbomb_backend.from_env("STATSBOMB_BACKEND", default="api")
+    container.config.open_data_dir.from_env("STATSBOMB_OPEN_DATA_DIR", default="data/open-data/data")
+    container.config.cache_dir.from_env("STATSBOMB_CACHE_DIR", default="data/cache")
+    container.config.competitions_ttl.from_env("STATSBOMB_COMPETITIONS_TTL", as_=int, default=600)
+    container.config.fetch_timeout.from_env("STATSBOMB_FETCH_TIMEOUT", as_=float, default=10.0)
+    container.config.fetch_retries.from_env("STATSBOMB_FETCH_RETRIES", as_=int, default=2)
+    container.config.fault_latency.from_env("STATSBOMB_FAULT_LATENCY", as_=float, default=0.5)
+    container.config.fault_error_rate.from_env("STATSBOMB_FAULT_ERROR_RATE", as_=float, default=0.2)
+    container.config.fault_hang_rate.from_env("STATSBOMB_FAULT_HANG_RATE", as_=float, default=0.05)
+    container.config.synthetic_matches.from_env("STATSBOMB_SYNTHETIC_MATCHES", as_=int, default=10_000)
+    container.config.synthetic_events_per_match.from_env("STATSBOMB_SYNTHETIC_EVENTS_PER_MATCH", as_=int, default=3500)
+    container.config.event_store_max_bytes.from_env("STATSBOMB_EVENT_STORE_MAX_BYTES", as_=int, default=512 * 1024 ** 2)
+    container.config.pitch_render_workers.from_env("PITCH_RENDER_WORKERS", as_=int, default=min(4, os.cpu_count() or 1))
+    RenderTracer.start_exporter(
+        port=int(os.environ.get("METRICS_PORT", 0)),
+        textfile_path=os.environ.get("METRICS_FILE")
+    )
+    return container
+
 @inject
-def main(main_view: AbstractStreamlitView = Provide[Container.main_view]) -> None:
+def main(main_view: AbstractStreamlitView = Provide["main_view"]) -> None:
     main_view.render()
 
 
@@ -59,10 +165,18 @@ if __name__ == "__main__":
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler("app.log"),
+            # Opened on the first record: the load test runs this file with
+            # logging already configured, and must not create app.log
+            logging.FileHandler("app.log", delay=True),
             logging.StreamHandler()
         ]
     )
-    container = Container()
+    # Must be the first Streamlit command of the run
+    st.set_page_config(
+        page_title="Soccer Analysis App",
+        page_icon="⚽",
+        layout="centered",
+    )
+    container = create_container()
     container.wire(modules=[__name__])
     main()
\ No newline at end of file
@@ -0,0 +1,91 @@
+import argparse
+import logging
+import time
+from typing import Callable, Dict, List
+import numpy as np
+from pandas import DataFrame
+import streamlit as st
+from benchmark.hot_path_benchmark import build_backend
+from enums.view_strategy import ViewStrategy
+from monitoring.render_tracer import RenderTracer
+from repository.statsbomb_repository import StatsBombRepository
+from service.match_event_store import MatchEventStore
+from service.match_prefetch_service import MatchPrefetchService
+from view.abstract_statsbomb_view import AbstractStatsBombView
+from view.word_cups_view import WordCupsView
+
+logger = logging.getLogger("cache_key_benchmark")
+
+# st.cache_data hashes every argument on each call, hits included. Times cache
+# hits of the views' get_cached_* methods, picked through the catalog like the
+# page does, and compares them with the old signature that took the whole
+# season matches frame as argument.
+
+
+@RenderTracer.cache_data(max_entries=1024, show_spinner=True)
+def get_cached_team_matches_by_frame(matches: DataFrame, team_name: str) -> DataFrame:
+    return matches[(matches["home_team"] == team_name) | (matches["away_team"] == team_name)]
+
+
+def time_hits(call: Callable[[], object], repeat: int) -> List[float]:
+    call()  # miss, fills the cache
+
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+def build_cases(view: AbstractStatsBombView) -> Dict[str, Callable[[], object]]:
+    repository = view.statsbomb_repository
+    catalog = repository.get_catalog()
+    competition_name = catalog.get_competition_names(ViewStrategy.WORLD_CUPS)[0]
+    season_name = catalog.get_season_names(competition_name)[0]
+    competition_id, season_id = catalog.get_season_ids(competition_name, season_name)
+    season_version = repository.get_season_version(competition_id, season_id)
+
+    matches = view.get_cached_matches(competition_id, season_id, season_version)
+    team_name = matches["home_team"].iloc[0]
+    match_id = int(matches["match_id"].iloc[0])
+    match_version = repository.get_match_version(match_id)
+
+    return {
+        "get_cached_matches": lambda: view.get_cached_matches(competition_id, season_id, season_version),
+        "get_cached_team_matches": lambda: view.get_cached_team_matches(competition_id, season_id, season_version, team_name),
+        "get_cached_season_teams_info": lambda: view.get_cached_season_teams_info(competition_id, season_id, season_version),
+        "get_cached_event_count_matrix": lambda: view.get_cached_event_count_matrix(match_id, match_version, "player"),
+        "team matches by frame": lambda: get_cached_team_matches_by_frame(matches, team_name),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cache hit cost of the views' get_cached_* methods")
+    parser.add_argument("--matches", type=int, action="append", help="Season size, can be repeated")
+    parser.add_argument("--events", type=int, default=100, help="Events per match")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for n_matches in args.matches or [380, 3000]:
+        repository = StatsBombRepository(build_backend(n_matches, args.events))
+        match_event_store = MatchEventStore(MatchPrefetchService(repository))
+        view = WordCupsView(repository, None, None, match_event_store, None)
+        st.cache_data.clear()
+
+        medians = {name: np.median(time_hits(call, args.repeat)) for name, call in build_cases(view).items()}
+
+        for name, median in medians.items():
+            logger.info(f"{n_matches} matches: {name} hit median {median:.3f} ms")
+        logger.info(
+            f"{n_matches} matches: team matches by id keys is "
+            f"{medians['team matches by frame'] / medians['get_cached_team_matches']:.1f}x cheaper than by frame"
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    main()
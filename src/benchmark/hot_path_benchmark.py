@@ -0,0 +1,173 @@
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict
+import matplotlib
+matplotlib.use("Agg")
+from enums.match_event import MatchEvent
+from enums.view_strategy import ViewStrategy
+from repository.match_index import MatchIndex
+from repository.statsbomb_repository import StatsBombRepository
+from repository.synthetic_open_data_backend import SyntheticOpenDataBackend
+from service.pitch_density_service import PitchDensityService
+from service.pitch_plot_renderer import PitchPlotRenderer
+from view.abstract_statsbomb_view import AbstractStatsBombView
+from view.word_cups_view import WordCupsView
+
+logger = logging.getLogger("hot_path_benchmark")
+
+# Times the repository and view hot paths on the synthetic backend the app and
+# the load test run on, and compares median time and peak memory with a stored
+# baseline. Exits with status 1 when a case got slower or bigger than the
+# baseline allows.
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "hot_path.json"
+
+# Absolute slack on top of the tolerance, so sub-millisecond cases don't flap
+NOISE_FLOOR = {"median_ms": 0.5, "peak_kb": 64}
+
+COMPETITION_ID = 1
+SEASON_ID = SyntheticOpenDataBackend.SEASON_ID_BASE
+
+
+def build_backend(n_matches: int, n_events: int) -> SyntheticOpenDataBackend:
+    # One season per competition, n_matches each
+    n_competitions = sum(len(category.get_competitions_list()) for category in ViewStrategy)
+    return SyntheticOpenDataBackend(
+        n_matches=n_matches * n_competitions,
+        events_per_match=n_events,
+        seasons_per_competition=1,
+        seed=0
+    )
+
+
+def build_cases(n_matches: int, n_events: int) -> Dict[str, Callable[[], object]]:
+    repository = StatsBombRepository(build_backend(n_matches, n_events))
+    view = WordCupsView(repository, None, None, None, None)
+
+    matches = repository.get_season_matches(COMPETITION_ID, SEASON_ID)
+    match = matches.iloc[0]
+    team_name, match_id = match["home_team"], int(match["match_id"])
+
+    season_version = repository.get_season_version(COMPETITION_ID, SEASON_ID)
+    build_team_matches = AbstractStatsBombView.get_cached_team_matches.__wrapped__
+    build_season_teams_info = AbstractStatsBombView.get_cached_season_teams_info.__wrapped__
+    teams_info = build_season_teams_info(view, COMPETITION_ID, SEASON_ID, season_version)
+    team_matches = build_team_matches(view, COMPETITION_ID, SEASON_ID, season_version, team_name)
+    match_option = team_matches["match_option"].iloc[-1]
+    match_index = repository.get_match_index(COMPETITION_ID, SEASON_ID)
+
+    split_events_dict = repository.get_split_match_events(match_id)
+    player_event_counts = repository.get_event_count_matrix(split_events_dict, "player")
+    player_name = player_event_counts.index[0]
+
+    shots = split_events_dict[MatchEvent.SHOTS.value]
+    team_shots = shots[shots["team"] == team_name].reset_index()
+    shots_density = PitchDensityService.density(team_shots["x"].to_numpy(), team_shots["y"].to_numpy())
+
+    passes = split_events_dict[MatchEvent.PASSES.value]
+    player_passes = passes[passes["player"] == player_name].reset_index()
+    passes_density = PitchDensityService.density(player_passes["x"].to_numpy(), player_passes["y"].to_numpy())
+
+    return {
+        "season_teams_info": lambda: build_season_teams_info(view, COMPETITION_ID, SEASON_ID, season_version),
+        # The team page looks the team up in the season table it cached
+        "get_team_info": lambda: repository.get_team_info(teams_info, team_name),
+        "build_match_index": lambda: MatchIndex(matches),
+        "match_index_get_match": lambda: match_index.get_match(match_option),
+        "get_match_events_info": lambda: repository.get_match_events_info(split_events_dict),
+        "get_event_count_matrix": lambda: repository.get_event_count_matrix(split_events_dict, "player"),
+        # The view looks players up in the matrix it cached for the match
+        "get_player_events_info": lambda: repository.get_player_events_info(player_name, player_event_counts),
+        "team_matches_options": lambda: build_team_matches(view, COMPETITION_ID, SEASON_ID, season_version, team_name),
+        "render_team_shots": lambda: PitchPlotRenderer.render_team_shots(team_shots, shots_density, view.pitch_style),
+        "render_player_passes": lambda: PitchPlotRenderer.render_player_passes(player_passes, passes_density, view.pitch_style),
+    }
+
+
+def measure(call: Callable[[], object], repeat: int) -> Dict[str, float]:
+    call()  # warm up
+
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started_at) * 1000)
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "peak_kb": peak / 1024,
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> int:
+    regressions = 0
+
+    for name, result in results.items():
+        if name not in baseline:
+            logger.info(f"{name}: no baseline")
+            continue
+
+        for metric in ("median_ms", "peak_kb"):
+            limit = baseline[name][metric] * (1 + tolerance) + NOISE_FLOOR[metric]
+            if result[metric] > limit:
+                regressions += 1
+                logger.error(f"{name}: {metric} {result[metric]:.2f} exceeds baseline {baseline[name][metric]:.2f} (+{tolerance:.0%})")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the repository and view hot paths")
+    parser.add_argument("--matches", type=int, default=380, help="Matches in the season")
+    parser.add_argument("--events", type=int, default=3500, help="Events per match")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--case", action="append", help="Run only this case, can be repeated")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown over the baseline")
+    args = parser.parse_args()
+
+    cases = build_cases(args.matches, args.events)
+    results = {}
+
+    for name, call in cases.items():
+        if args.case and name not in args.case:
+            continue
+        results[name] = measure(call, args.repeat)
+        logger.info(
+            f"{name}: median {results[name]['median_ms']:.2f} ms, "
+            f"min {results[name]['min_ms']:.2f} ms, peak {results[name]['peak_kb']:.0f} KB"
+        )
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        logger.info(f"Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        logger.warning(f"No baseline at {args.baseline}, run with --save-baseline first")
+        return
+
+    if compare(results, json.loads(args.baseline.read_text()), args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+logger = logging.getLogger("import_time_report")
+
+# Cold import cost of the app and of the plotting stacks each menu option
+# loads on first use, every sample in a fresh interpreter. "eager" imports
+# everything up front, like the views did before loading plots lazily.
+
+SRC_DIR = Path(__file__).parent.parent
+
+HEAVY_MODULES = ["matplotlib", "mplsoccer", "scipy", "plotly.express"]
+
+SCENARIOS = {
+    "startup (Home)": [],
+    "Team menu": ["plotly.express"],
+    "render pool worker": ["service.pitch_plot_renderer"],
+    "eager": ["plotly.express", "service.pitch_plot_renderer"],
+}
+
+PROBE = """
+import json, sys, time
+started_at = time.perf_counter()
+import app
+app_loaded_at = time.perf_counter()
+for module in {modules!r}:
+    __import__(module)
+print(json.dumps({{
+    "app_ms": (app_loaded_at - started_at) * 1000,
+    "total_ms": (time.perf_counter() - started_at) * 1000,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def probe(modules: List[str]) -> Dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(modules=modules, heavy=HEAVY_MODULES)],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report cold import times per menu option")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, modules in SCENARIOS.items():
+        samples = [probe(modules) for _ in range(args.repeat)]
+        total_ms = statistics.median(sample["total_ms"] for sample in samples)
+        app_ms = statistics.median(sample["app_ms"] for sample in samples)
+
+        logger.info(
+            f"{name:>18}: {total_ms:7.0f} ms (app {app_ms:.0f} ms + plotting {total_ms - app_ms:.0f} ms), "
+            f"loaded: {', '.join(samples[-1]['loaded']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    main()
@@ -0,0 +1,200 @@
+import argparse
+import logging
+import os
+import random
+import multiprocessing
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+import numpy as np
+import psutil
+from streamlit.testing.v1 import AppTest
+from enums.statsbomb_view_menu_option import StatsBombViewMenuOption
+from enums.view_strategy import ViewStrategy
+
+logger = logging.getLogger("load_test")
+
+# Drives N headless sessions of the app concurrently, one process each, on a
+# shared on-disk cache. Each session navigates like an analyst: picks a page in
+# the sidebar, a random competition, season and team, then goes through the
+# Team, Match and Player menus. Exits with status 1 when any rerun showed an
+# exception or an error dialog.
+
+APP_PATH = str(Path(__file__).parent.parent / "app.py")
+PROJECT_DIR = Path(__file__).parent.parent.parent
+
+VIEW_MENU_KEYS = {
+    ViewStrategy.WORLD_CUPS: "World Cup_view_menu",
+    ViewStrategy.NATIONAL_COMPETITIONS: "National Competitions_view_menu",
+    ViewStrategy.INTERNATIONAL_COMPETITIONS: "International Competitions_view_menu",
+}
+
+
+class Session:
+
+    def __init__(self, session_id: int, timeout: float) -> None:
+        self.session_id = session_id
+        self.rng = random.Random(session_id)
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.timings: List[Tuple[str, float]] = []
+        self.reruns = 0
+        self.errors = 0
+        self.view_strategy = ViewStrategy.HOME
+        self.menu_option = StatsBombViewMenuOption.TEAM
+
+    def run_step(self, step: str) -> None:
+        # AppTest doesn't send the custom components' values back, the option
+        # menus are set through their session state keys before every run
+        self.app.session_state["sidebar_menu"] = self.view_strategy.value
+        if self.view_strategy in VIEW_MENU_KEYS:
+            self.app.session_state[VIEW_MENU_KEYS[self.view_strategy]] = self.menu_option.value
+
+        started_at = time.perf_counter()
+        self.app.run()
+        self.timings.append((step, (time.perf_counter() - started_at) * 1000))
+        self.reruns += 1
+
+        # MainView turns render errors into an error dialog instead of an exception
+        failures = [e.message for e in self.app.exception] + [e.value for e in self.app.error]
+        failures += [w.value for w in self.app.warning if "StatsBomb" in w.value]
+        if failures:
+            self.errors += 1
+            logger.warning(f"Session {self.session_id} {step}: {failures[0]}")
+
+    def select(self, label: str) -> bool:
+        selectbox = next((s for s in self.app.selectbox if s.label == label), None)
+        if selectbox is None or not selectbox.options:
+            return False
+
+        selectbox.set_value(self.rng.choice(selectbox.options))
+        return True
+
+    def navigate(self, view_strategy: ViewStrategy) -> None:
+        self.view_strategy = view_strategy
+        self.menu_option = StatsBombViewMenuOption.TEAM
+        self.run_step("open page")
+
+        for label in ("Competition", "Season", "Team Name"):
+            if self.select(label):
+                self.run_step(f"select {label.lower()}")
+
+        self.menu_option = StatsBombViewMenuOption.MATCH
+        self.run_step("match menu")
+        if self.select("Match"):
+            self.run_step("select match")
+
+        self.menu_option = StatsBombViewMenuOption.PLAYER
+        self.run_step("player menu")
+        if self.select("Player"):
+            self.run_step("select player")
+
+    def run(self, iterations: int) -> None:
+        self.run_step("home")
+
+        for _ in range(iterations):
+            self.navigate(self.rng.choice(list(VIEW_MENU_KEYS)))
+
+
+# Runs in a session process. AppTest swaps the process-wide Runtime singleton
+# on every run, so concurrent sessions each get a process of their own.
+def init_session_process() -> None:
+    # Before AppTest runs app.py as __main__, so its basicConfig is a no-op
+    # and the sessions' logs don't end up in the project's app.log
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    # The app loads its images relative to the project directory
+    os.chdir(PROJECT_DIR)
+
+
+def run_session(session_id: int, iterations: int, timeout: float) -> Tuple[List[Tuple[str, float]], int, int]:
+    session = Session(session_id, timeout)
+    try:
+        session.run(iterations)
+    finally:
+        # The app's render pool workers would keep this process from exiting
+        for child in multiprocessing.active_children():
+            child.terminate()
+    return session.timings, session.reruns, session.errors
+
+
+def report(results: List[Tuple[List[Tuple[str, float]], int, int]], elapsed: float, rss_samples: List[int]) -> int:
+    step_timings: Dict[str, List[float]] = defaultdict(list)
+    for timings, _, _ in results:
+        for step, timing in timings:
+            step_timings[step].append(timing)
+
+    for step, timings in step_timings.items():
+        p50, p90, p99 = np.percentile(timings, [50, 90, 99])
+        logger.info(f"{step:>16}: n={len(timings):<5} p50 {p50:8.1f} ms  p90 {p90:8.1f} ms  p99 {p99:8.1f} ms  max {max(timings):8.1f} ms")
+
+    reruns = sum(result[1] for result in results)
+    errors = sum(result[2] for result in results)
+    logger.info(f"{len(results)} sessions, {reruns} reruns ({reruns / elapsed:.2f}/s), {errors} failed, {elapsed:.1f}s")
+    logger.info(
+        f"RSS of all processes {rss_samples[0] / 1024 ** 2:.0f} MB -> {rss_samples[-1] / 1024 ** 2:.0f} MB "
+        f"(peak {max(rss_samples) / 1024 ** 2:.0f} MB)"
+    )
+    return errors
+
+
+def get_tree_rss(process: psutil.Process) -> int:
+    rss = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            rss += child.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+    return rss
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run concurrent headless sessions of the app")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=3, help="Pages each session goes through")
+    parser.add_argument("--timeout", type=float, default=300, help="Seconds a single rerun may take")
+    args = parser.parse_args()
+
+    # A synthetic backend by default, the load test must not hit the StatsBomb API
+    os.environ.setdefault("STATSBOMB_BACKEND", "synthetic")
+
+    process = psutil.Process()
+    rss_samples = [get_tree_rss(process)]
+    done = threading.Event()
+
+    def sample_rss() -> None:
+        while not done.wait(0.5):
+            rss_samples.append(get_tree_rss(process))
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+
+    started_at = time.perf_counter()
+
+    with ProcessPoolExecutor(
+            max_workers=args.sessions,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_session_process
+        ) as executor:
+        futures = [executor.submit(run_session, session_id, args.iterations, args.timeout) for session_id in range(args.sessions)]
+        results = [future.result() for future in futures]
+
+    elapsed = time.perf_counter() - started_at
+    done.set()
+    sampler.join()
+
+    if report(results, elapsed, rss_samples):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    main()
@@ -1,29 +1,27 @@
 import streamlit as st
 from pandas import DataFrame
-from typing import Tuple
+from typing import List, Tuple
+from repository.competition_catalog import CompetitionCatalog
 
 class SelectBoxes:
         
     @staticmethod
-    def select_competition_and_season(competitions: DataFrame) -> Tuple[str, str, DataFrame]:
+    def select_competition_and_season(catalog: CompetitionCatalog, competition_names: List[str]) -> Tuple[str, str]:
         col1, col2 = st.columns(2)
         
         with col1:
             competition_name = st.selectbox(
                 "Competition",
-                competitions["competition_name"].unique()
+                competition_names
             )
         
         with col2:
-            competition = competitions[competitions["competition_name"] == competition_name]
-    
-            
             season_name = st.selectbox(
                 "Season",
-                competition["season_name"].unique()
+                catalog.get_season_names(competition_name)
             )
             
-        return competition_name, season_name, competition
+        return competition_name, season_name
     
     @staticmethod
     def team_select(matches: DataFrame) -> str:
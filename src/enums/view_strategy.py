@@ -1,8 +1,43 @@
 from enum import Enum
+from typing import List
 
 
 class ViewStrategy(Enum):
     HOME = "Home"
     WORLD_CUPS = "World Cups"
     INTERNATIONAL_COMPETITIONS = "International Competitions"
-    NATIONAL_COMPETITIONS = "National Competitions"
\ No newline at end of file
+    NATIONAL_COMPETITIONS = "National Competitions"
+    
+    def get_competitions_list(self) -> List[str]:
+        return VIEW_STRATEGY_COMPETITIONS.get(self, [])
+
+
+VIEW_STRATEGY_COMPETITIONS = {
+    ViewStrategy.WORLD_CUPS: [
+        "FIFA U20 World Cup", 
+        "FIFA World Cup", 
+        "Women's World Cup"
+    ],
+    ViewStrategy.INTERNATIONAL_COMPETITIONS: [
+        'African Cup of Nations',
+        'Champions League',
+        'Copa America',
+        'UEFA Euro',
+        'UEFA Europa League',
+        "UEFA Women's Euro"
+    ],
+    ViewStrategy.NATIONAL_COMPETITIONS: [
+        'Bundesliga',
+        'Copa del Rey',
+        "FA Women's Super League",
+        'Indian Super League',
+        'La Liga',
+        'Liga Profesional',
+        'Ligue 1',
+        'Major League Soccer',
+        'North American League',
+        'NWSL',
+        'Premier League',
+        'Serie A'
+    ],
+}
\ No newline at end of file
@@ -0,0 +1,90 @@
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, List
+from repository.synthetic_open_data_backend import SyntheticOpenDataBackend
+
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+logger = logging.getLogger("generate_open_data")
+
+worker_backend: SyntheticOpenDataBackend | None = None
+worker_output_dir: Path | None = None
+
+
+def init_worker(n_matches: int, events_per_match: int, seasons_per_competition: int, seed: int, output_dir: str) -> None:
+    global worker_backend, worker_output_dir
+    worker_backend = SyntheticOpenDataBackend(n_matches, events_per_match, seasons_per_competition, seed)
+    worker_output_dir = Path(output_dir)
+
+
+def write_json(relative_path: str) -> int:
+    path = worker_output_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = json_dumps(worker_backend.build_json(relative_path))
+    path.write_bytes(data)
+    return len(data)
+
+
+def get_relative_paths(backend: SyntheticOpenDataBackend) -> List[str]:
+    relative_paths = ["competitions.json"]
+    relative_paths += [
+        f"matches/{competition['competition_id']}/{competition['season_id']}.json"
+        for competition in backend.build_competitions()
+    ]
+    for match_id in backend.get_match_ids():
+        relative_paths += [f"lineups/{match_id}.json", f"events/{match_id}.json"]
+
+    return relative_paths
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Write a synthetic StatsBomb open data tree")
+    parser.add_argument("--output-dir", default="data/synthetic/data")
+    parser.add_argument("--matches", type=int, default=10_000, help="Total matches, spread over every season")
+    parser.add_argument("--events-per-match", type=int, default=500)
+    parser.add_argument("--seasons-per-competition", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    init_args = (args.matches, args.events_per_match, args.seasons_per_competition, args.seed, args.output_dir)
+
+    backend = SyntheticOpenDataBackend(args.matches, args.events_per_match, args.seasons_per_competition, args.seed)
+    relative_paths = get_relative_paths(backend)
+    n_matches = len(backend.get_match_ids())
+    logger.info(f"Writing {n_matches} matches, {n_matches * args.events_per_match} events to {args.output_dir}")
+
+    started_at = time.perf_counter()
+    bytes_written = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker, initargs=init_args) as executor:
+        for written, size in enumerate(executor.map(write_json, relative_paths, chunksize=16), start=1):
+            bytes_written += size
+            if written % 1000 == 0:
+                logger.info(f"{written}/{len(relative_paths)} files written")
+
+    elapsed = time.perf_counter() - started_at
+    logger.info(f"Wrote {len(relative_paths)} files, {bytes_written / 1024 ** 2:.1f} MB in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    main()
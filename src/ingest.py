@@ -0,0 +1,147 @@
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Tuple
+from enums.view_strategy import ViewStrategy
+from repository.abstract_statsbomb_backend import AbstractStatsBombBackend
+from repository.competition_catalog import CompetitionCatalog
+from repository.local_open_data_backend import LocalOpenDataBackend
+from repository.parquet_store import ParquetStore
+from repository.resilient_backend import ResilientStatsBombBackend
+from repository.statsbomb_api_backend import StatsBombApiBackend
+from repository.statsbomb_repository import StatsBombRepository
+from repository.synthetic_open_data_backend import SyntheticOpenDataBackend
+
+logger = logging.getLogger("ingest")
+
+worker_repository: StatsBombRepository | None = None
+
+
+def create_source(backend: str, open_data_dir: str) -> AbstractStatsBombBackend:
+    if backend == "local":
+        return LocalOpenDataBackend(open_data_dir)
+    if backend == "synthetic":
+        return SyntheticOpenDataBackend(
+            n_matches=int(os.environ.get("STATSBOMB_SYNTHETIC_MATCHES", 10_000)),
+            events_per_match=int(os.environ.get("STATSBOMB_SYNTHETIC_EVENTS_PER_MATCH", 3500))
+        )
+    return StatsBombApiBackend()
+
+
+def create_backend(backend: str, open_data_dir: str) -> AbstractStatsBombBackend:
+    return ResilientStatsBombBackend(
+        create_source(backend, open_data_dir),
+        timeout=float(os.environ.get("STATSBOMB_FETCH_TIMEOUT", 10.0)),
+        retries=int(os.environ.get("STATSBOMB_FETCH_RETRIES", 2))
+    )
+
+
+def init_worker(backend: str, open_data_dir: str, cache_dir: str) -> None:
+    global worker_repository
+    worker_repository = StatsBombRepository(
+        create_backend(backend, open_data_dir),
+        ParquetStore(cache_dir),
+        stale_while_revalidate=False
+    )
+
+
+def ingest_match(competition_id: int, season_id: int, match_id: int) -> int:
+    # Loads the versions of the season's matches, the store keys on them
+    worker_repository.get_season_matches(competition_id, season_id)
+    worker_repository.get_split_match_events(match_id)
+    worker_repository.get_lineups(match_id)
+    return match_id
+
+
+def select_seasons(catalog: CompetitionCatalog, args: argparse.Namespace) -> List[Tuple[str, str]]:
+    competition_names = list(args.competition or [])
+    for category in args.category or []:
+        competition_names += catalog.get_competition_names(ViewStrategy(category))
+
+    return [
+        (competition_name, season_name)
+        for competition_name in dict.fromkeys(competition_names)
+        for season_name in catalog.get_season_names(competition_name)
+        if not args.season or season_name in args.season
+    ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ingest StatsBomb seasons into the local Parquet store")
+    parser.add_argument("--competition", action="append", help="Competition name, can be repeated")
+    parser.add_argument("--season", action="append", help="Season name, can be repeated (default: all seasons)")
+    parser.add_argument(
+        "--category",
+        action="append",
+        choices=[e.value for e in ViewStrategy if e.get_competitions_list()],
+        help="Every competition of an app menu category, can be repeated"
+    )
+    parser.add_argument("--backend", default=os.environ.get("STATSBOMB_BACKEND", "api"), choices=["api", "local", "synthetic"])
+    parser.add_argument("--open-data-dir", default=os.environ.get("STATSBOMB_OPEN_DATA_DIR", "data/open-data/data"))
+    parser.add_argument("--cache-dir", default=os.environ.get("STATSBOMB_CACHE_DIR", "data/cache"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+
+    args = parser.parse_args()
+    if not args.competition and not args.category:
+        parser.error("at least one --competition or --category is required")
+
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    parquet_store = ParquetStore(args.cache_dir)
+    # Ingest wants the current data, not whatever was cached before
+    repository = StatsBombRepository(
+        create_backend(args.backend, args.open_data_dir),
+        parquet_store,
+        stale_while_revalidate=False
+    )
+    size_before = parquet_store.get_size()
+    started_at = time.perf_counter()
+
+    catalog = repository.get_catalog()
+    match_ids = []
+    for competition_name, season_name in select_seasons(catalog, args):
+        competition_id, season_id = catalog.get_season_ids(competition_name, season_name)
+        matches = repository.get_season_matches(competition_id, season_id)
+        logger.info(f"{competition_name} {season_name}: {len(matches)} matches")
+        match_ids += [(competition_id, season_id, match_id) for match_id in matches["match_id"].astype(int)]
+
+    ingested = 0
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        initializer=init_worker,
+        initargs=(args.backend, args.open_data_dir, args.cache_dir)
+    ) as executor:
+        futures = {executor.submit(ingest_match, *match_key): match_key[2] for match_key in match_ids}
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+                ingested += 1
+            except Exception as e:
+                logger.error(f"Failed to ingest match {futures[future]}: {e}")
+
+            if ingested and ingested % 50 == 0:
+                logger.info(f"{ingested}/{len(match_ids)} matches ingested")
+
+    elapsed = time.perf_counter() - started_at
+    megabytes_written = (parquet_store.get_size() - size_before) / 1024 ** 2
+
+    logger.info(
+        f"Ingested {ingested}/{len(match_ids)} matches in {elapsed:.1f}s "
+        f"({ingested / elapsed:.2f} matches/s), {megabytes_written:.1f} MB written "
+        f"({megabytes_written / elapsed:.2f} MB/s)"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    main()
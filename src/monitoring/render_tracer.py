@@ -0,0 +1,145 @@
+import contextvars
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram, start_http_server, write_to_textfile
+import streamlit as st
+
+
+# Timing spans of the render path. Every span is logged and observed in a
+# Prometheus histogram labelled with the page (sidebar option) being rendered;
+# spans run outside a page, like the prefetch threads, are labelled "background".
+# The MatchEventStore's size is exported alongside, as gauges.
+class RenderTracer:
+    logger = logging.getLogger(__name__)
+
+    SPAN_SECONDS = Histogram(
+        "soccer_app_span_seconds",
+        "Duration of render path spans",
+        ["span", "page"],
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+    )
+    CACHE_REQUESTS = Counter(
+        "soccer_app_cache_requests_total",
+        "st.cache_data lookups of the get_cached_* methods",
+        ["method", "result"]
+    )
+    MATCH_EVENT_STORE_BYTES = Gauge(
+        "soccer_app_match_event_store_bytes",
+        "Memory taken by the split events held in the MatchEventStore"
+    )
+    MATCH_EVENT_STORE_MAX_BYTES = Gauge(
+        "soccer_app_match_event_store_max_bytes",
+        "Memory budget of the MatchEventStore"
+    )
+    MATCH_EVENT_STORE_MATCHES = Gauge(
+        "soccer_app_match_event_store_matches",
+        "Matches held in the MatchEventStore"
+    )
+
+    page: contextvars.ContextVar[str] = contextvars.ContextVar("page", default="background")
+    cache_misses: contextvars.ContextVar[List[bool] | None] = contextvars.ContextVar("cache_misses", default=None)
+
+    textfile_path: str | None = None
+    textfile_interval = 10.0
+    textfile_written_at = 0.0
+    textfile_lock = threading.Lock()
+
+    @staticmethod
+    def start_exporter(port: int | None = None, textfile_path: str | None = None, textfile_interval: float = 10.0) -> None:
+        if port:
+            start_http_server(port)
+            RenderTracer.logger.info(f"Serving Prometheus metrics on port {port}")
+
+        RenderTracer.textfile_path = textfile_path or None
+        RenderTracer.textfile_interval = textfile_interval
+
+    @staticmethod
+    def flush(force: bool = False) -> None:
+        if RenderTracer.textfile_path is None:
+            return
+
+        with RenderTracer.textfile_lock:
+            now = time.monotonic()
+            if not force and now - RenderTracer.textfile_written_at < RenderTracer.textfile_interval:
+                return
+            RenderTracer.textfile_written_at = now
+
+            try:
+                write_to_textfile(RenderTracer.textfile_path, REGISTRY)
+            except OSError as e:
+                RenderTracer.logger.warning(f"Could not write metrics to {RenderTracer.textfile_path}: {e}")
+
+    @staticmethod
+    @contextmanager
+    def span(name: str, level: int = logging.DEBUG) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started_at
+            page = RenderTracer.page.get()
+            RenderTracer.SPAN_SECONDS.labels(name, page).observe(elapsed)
+            RenderTracer.logger.log(level, f"[{page}] {name} took {elapsed * 1000:.1f} ms")
+
+    @staticmethod
+    @contextmanager
+    def page_span(page: str, name: str) -> Iterator[None]:
+        token = RenderTracer.page.set(page)
+        try:
+            with RenderTracer.span(name, logging.INFO):
+                yield
+        finally:
+            RenderTracer.page.reset(token)
+
+    @staticmethod
+    def traced(name: str | None = None, level: int = logging.DEBUG) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with RenderTracer.span(span_name, level):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    # Drop-in for st.cache_data that also records whether a call was a hit: the
+    # wrapped body only runs on a miss, and flags the innermost pending lookup.
+    @staticmethod
+    def cache_data(**cache_kwargs) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def on_miss(*args, **kwargs):
+                pending = RenderTracer.cache_misses.get()
+                if pending:
+                    pending[-1] = True
+                return func(*args, **kwargs)
+
+            cached = st.cache_data(**cache_kwargs)(on_miss)
+            span_name = func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                pending = RenderTracer.cache_misses.get()
+                if pending is None:
+                    pending = []
+                    RenderTracer.cache_misses.set(pending)
+
+                pending.append(False)
+                try:
+                    with RenderTracer.span(span_name):
+                        return cached(*args, **kwargs)
+                finally:
+                    result = "miss" if pending.pop() else "hit"
+                    RenderTracer.CACHE_REQUESTS.labels(func.__name__, result).inc()
+
+            wrapper.clear = cached.clear
+            return wrapper
+
+        return decorator
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+from pandas import DataFrame
+
+class AbstractStatsBombBackend(ABC):
+    
+    @abstractmethod
+    def competitions(self) -> DataFrame:
+        pass
+    
+    @abstractmethod
+    def matches(self, competition_id: int, season_id: int) -> DataFrame:
+        pass
+    
+    @abstractmethod
+    def lineups(self, match_id: int) -> Dict[str, DataFrame]:
+        pass
+    
+    @abstractmethod
+    def events(self, match_id: int) -> Dict[str, DataFrame]:
+        pass
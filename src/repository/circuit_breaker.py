@@ -0,0 +1,52 @@
+import logging
+import threading
+import time
+
+
+# Stops calling a failing upstream for a while. After failure_threshold
+# consecutive failures the circuit opens and every call is refused for
+# reset_timeout seconds, then a single trial call is let through (half open):
+# its success closes the circuit, its failure opens it again.
+class CircuitBreaker:
+    logger = logging.getLogger(__name__)
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self.lock:
+            if self.state == CircuitBreaker.CLOSED:
+                return True
+
+            if self.state == CircuitBreaker.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = CircuitBreaker.HALF_OPEN
+                return True
+
+            # Open, or half open with the trial call still running
+            return False
+
+    def record_success(self) -> None:
+        with self.lock:
+            if self.state != CircuitBreaker.CLOSED:
+                CircuitBreaker.logger.info("Circuit closed, upstream is back")
+            self.state = CircuitBreaker.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+
+            if self.state == CircuitBreaker.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != CircuitBreaker.OPEN:
+                    CircuitBreaker.logger.warning(f"Circuit open for {self.reset_timeout:.0f}s after {self.failures} failures")
+                self.state = CircuitBreaker.OPEN
+                self.opened_at = time.monotonic()
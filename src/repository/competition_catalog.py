@@ -0,0 +1,48 @@
+from typing import Dict, List, Tuple
+from pandas import DataFrame
+
+from enums.view_strategy import ViewStrategy
+
+
+# Indexes the competitions frame once, so picking a category, competition and
+# season is a dictionary lookup instead of a boolean mask over the frame
+class CompetitionCatalog:
+    def __init__(self, competitions: DataFrame) -> None:
+        self.seasons: Dict[str, Dict[str, Dict]] = {}
+        self.seasons_by_ids: Dict[Tuple[int, int], Dict] = {}
+        self.competition_names: Dict[ViewStrategy, List[str]] = {}
+
+        for row in competitions.to_dict("records"):
+            season = {
+                "competition_id": int(row["competition_id"]),
+                "season_id": int(row["season_id"]),
+                "competition_name": row["competition_name"],
+                "season_name": row["season_name"],
+                "match_updated": row.get("match_updated"),
+                "match_available": row.get("match_available"),
+                # Changes whenever StatsBomb updates or adds matches of the season
+                "version": f"{row.get('match_updated') or ''}|{row.get('match_available') or ''}",
+            }
+            self.seasons.setdefault(row["competition_name"], {}).setdefault(row["season_name"], season)
+            self.seasons_by_ids[(season["competition_id"], season["season_id"])] = season
+
+        for view_strategy in ViewStrategy:
+            category_names = set(view_strategy.get_competitions_list())
+            # Same order as the competitions frame
+            self.competition_names[view_strategy] = [name for name in self.seasons if name in category_names]
+
+    def get_competition_names(self, view_strategy: ViewStrategy) -> List[str]:
+        return self.competition_names[view_strategy]
+
+    def get_season_names(self, competition_name: str) -> List[str]:
+        return list(self.seasons.get(competition_name, {}))
+
+    def get_season(self, competition_name: str, season_name: str) -> Dict:
+        return self.seasons[competition_name][season_name]
+
+    def get_season_by_ids(self, competition_id: int, season_id: int) -> Dict:
+        return self.seasons_by_ids[(competition_id, season_id)]
+
+    def get_season_ids(self, competition_name: str, season_name: str) -> Tuple[int, int]:
+        season = self.get_season(competition_name, season_name)
+        return season["competition_id"], season["season_id"]
@@ -0,0 +1,66 @@
+import logging
+import random
+import threading
+import time
+from typing import Dict
+from pandas import DataFrame
+from repository.abstract_statsbomb_backend import AbstractStatsBombBackend
+
+
+class InjectedFaultError(ConnectionError):
+    pass
+
+
+# Local stand-in for a degraded StatsBomb: wraps another backend and delays,
+# fails or hangs a share of its calls. Selected with STATSBOMB_BACKEND=faulty
+# to see how the app behaves when the data source misbehaves.
+class FaultInjectingBackend(AbstractStatsBombBackend):
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+            self,
+            backend: AbstractStatsBombBackend,
+            latency: float = 0.0,
+            error_rate: float = 0.0,
+            hang_rate: float = 0.0,
+            hang_seconds: float = 60.0,
+            seed: int | None = None
+        ) -> None:
+        self.backend = backend
+        self.latency = latency
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def competitions(self) -> DataFrame:
+        self._inject("competitions")
+        return self.backend.competitions()
+
+    def matches(self, competition_id: int, season_id: int) -> DataFrame:
+        self._inject(f"matches {competition_id}/{season_id}")
+        return self.backend.matches(competition_id, season_id)
+
+    def lineups(self, match_id: int) -> Dict[str, DataFrame]:
+        self._inject(f"lineups {match_id}")
+        return self.backend.lineups(match_id)
+
+    def events(self, match_id: int) -> Dict[str, DataFrame]:
+        self._inject(f"events {match_id}")
+        return self.backend.events(match_id)
+
+    def _inject(self, name: str) -> None:
+        with self.lock:
+            draw = self.rng.random()
+            # Up to twice the configured latency, averaging the latency
+            delay = self.rng.uniform(0, 2 * self.latency)
+
+        if draw < self.hang_rate:
+            FaultInjectingBackend.logger.info(f"Hanging {name} for {self.hang_seconds:.0f}s")
+            time.sleep(self.hang_seconds)
+        else:
+            time.sleep(delay)
+
+        if draw >= 1 - self.error_rate:
+            raise InjectedFaultError(f"Injected failure of {name}")
@@ -0,0 +1,80 @@
+from pathlib import Path
+from typing import Any, Dict
+import pandas as pd
+from pandas import DataFrame
+from statsbombpy import entities
+from statsbombpy.helpers import filter_and_group_events
+from repository.abstract_statsbomb_backend import AbstractStatsBombBackend
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Reads a local clone of https://github.com/statsbomb/open-data and builds the
+# same DataFrames statsbombpy builds from the remote files.
+class LocalOpenDataBackend(AbstractStatsBombBackend):
+    def __init__(self, data_dir: str) -> None:
+        self.data_dir = Path(data_dir)
+
+    def competitions(self) -> DataFrame:
+        # Deduplicated by country, competition, season and gender like sb.competitions
+        competitions = entities.competitions(self._load_json("competitions.json"))
+        return pd.DataFrame(competitions.values())
+
+    def matches(self, competition_id: int, season_id: int) -> DataFrame:
+        matches = entities.matches(self._load_json(f"matches/{competition_id}/{season_id}.json"))
+
+        home_managers = [
+            ", ".join(m["name"] for m in match["home_team"].get("managers", []))
+            for match in matches.values()
+        ]
+        away_managers = [
+            ", ".join(m["name"] for m in match["away_team"].get("managers", []))
+            for match in matches.values()
+        ]
+
+        matches = pd.DataFrame(matches.values())
+        matches["competition"] = matches.competition.apply(
+            lambda c: f"{c['country_name']} - {c['competition_name']}"
+        )
+        for col in ["season", "home_team", "away_team"]:
+            matches[col] = matches[col].apply(lambda c: c[f"{col}_name"])
+        for col in ["competition_stage", "stadium", "referee"]:
+            if col in matches.columns:
+                matches[col] = matches[col].apply(lambda x: x["name"] if isinstance(x, dict) else x)
+        matches["home_managers"] = home_managers
+        matches["away_managers"] = away_managers
+        metadata = matches.pop("metadata")
+        for k in ["data_version", "shot_fidelity_version", "xy_fidelity_version"]:
+            matches[k] = metadata.apply(lambda x: x.get(k) if isinstance(x, dict) else None)
+
+        return matches
+
+    def lineups(self, match_id: int) -> Dict[str, DataFrame]:
+        lineups = entities.lineups(self._load_json(f"lineups/{match_id}.json"))
+
+        lineups_dict = {}
+        for lineup in lineups.values():
+            lineup_df = pd.DataFrame(lineup["lineup"])
+            lineup_df["country"] = lineup_df.country.apply(
+                lambda c: c["name"] if isinstance(c, dict) else "Unknown"
+            )
+            lineups_dict[lineup["team_name"]] = lineup_df
+
+        return lineups_dict
+
+    def events(self, match_id: int) -> Dict[str, DataFrame]:
+        events = entities.events(self._load_json(f"events/{match_id}.json"), match_id)
+        grouped_events = filter_and_group_events(events, {}, "dataframe", True)
+
+        return {ev_type: pd.DataFrame(evs) for ev_type, evs in grouped_events.items()}
+
+    def _load_json(self, relative_path: str) -> Any:
+        path = self.data_dir / relative_path
+
+        if not path.exists():
+            raise FileNotFoundError(f"StatsBomb open data file not found: {path}")
+
+        return json_loads(path.read_bytes())
@@ -0,0 +1,50 @@
+from typing import Dict, Tuple
+from pandas import DataFrame, Series
+
+
+# Resolves the match selectbox labels of a season to their match in constant
+# time, the labels and the match info records are built once per season
+class MatchIndex:
+    def __init__(self, matches: DataFrame) -> None:
+        self.matches = matches
+        self.match_options = MatchIndex.build_match_options(matches)
+        self.match_ids: Dict[str, int] = {}
+        self.positions: Dict[int, int] = {}
+        self.matches_info: Dict[int, Dict] = {}
+
+        records = matches[[
+            "match_id", "match_date", "home_team", "away_team",
+            "home_score", "away_score", "competition_stage", "stadium"
+        ]].to_dict("records")
+
+        for position, (match_option, record) in enumerate(zip(self.match_options, records)):
+            match_id = int(record["match_id"])
+            # The first match wins a duplicated label, like the old lookup did
+            self.match_ids.setdefault(match_option, match_id)
+            self.positions.setdefault(match_id, position)
+            self.matches_info.setdefault(match_id, {
+                **record,
+                "match_id": match_id,
+                "home_score": int(record["home_score"]),
+                "away_score": int(record["away_score"]),
+            })
+
+    @staticmethod
+    def build_match_options(matches: DataFrame) -> Series:
+        return (
+            matches["match_date"].astype(str) + ": "
+            + matches["home_team"].astype(str) + " vs "
+            + matches["away_team"].astype(str)
+        )
+
+    def get_match_id(self, match_option: str) -> int:
+        return self.match_ids[match_option]
+
+    def get_match_info(self, match_id: int) -> Dict:
+        return self.matches_info[match_id]
+
+    def get_match(self, match_option: str) -> Tuple[Dict, DataFrame]:
+        match_id = self.get_match_id(match_option)
+        position = self.positions[match_id]
+
+        return self.matches_info[match_id], self.matches.iloc[position:position + 1]
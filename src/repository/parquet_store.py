@@ -0,0 +1,169 @@
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+from urllib.parse import quote, unquote
+import pandas as pd
+from pandas import DataFrame
+
+
+class ParquetStore:
+    logger = logging.getLogger(__name__)
+
+    LAYOUT_VERSION = "v3"
+
+    def __init__(
+            self,
+            base_dir: str = "data/cache",
+            competitions_ttl: int = 3600
+        ) -> None:
+        self.base_dir = Path(base_dir) / ParquetStore.LAYOUT_VERSION
+        self.competitions_ttl = competitions_ttl
+
+    # A stale copy is one past its ttl, still better than nothing when the
+    # upstream is down
+    def get_competitions(self, allow_stale: bool = False) -> DataFrame | None:
+        path = self.base_dir / "competitions.parquet"
+
+        if not path.exists():
+            return None
+        if not allow_stale and time.time() - path.stat().st_mtime > self.competitions_ttl:
+            return None
+
+        return self._read_frame(path)
+
+    def put_competitions(self, competitions: DataFrame) -> None:
+        self._write_frame(self.base_dir / "competitions.parquet", competitions)
+
+    # Matches, lineups and events are stored under the version of the data
+    # they were fetched at. Another version is a miss, and storing a version
+    # drops the ones stored before it.
+    def get_matches(self, competition_id: int, season_id: int, version: str) -> DataFrame | None:
+        return self._read_frame(self._matches_dir(competition_id, season_id) / f"{self._version_name(version)}.parquet")
+
+    # Whichever version is stored, with the version it was stored at
+    def get_latest_matches(self, competition_id: int, season_id: int) -> Tuple[str, DataFrame] | None:
+        matches_dir = self._matches_dir(competition_id, season_id)
+        if not matches_dir.is_dir():
+            return None
+
+        paths = []
+        for path in matches_dir.glob("*.parquet"):
+            try:
+                paths.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                # Dropped by a writer storing a newer version
+                continue
+
+        for _, path in sorted(paths, reverse=True):
+            matches = self._read_frame(path)
+            if matches is not None:
+                return ("" if path.stem == "-" else unquote(path.stem)), matches
+
+        return None
+
+    def put_matches(self, competition_id: int, season_id: int, version: str, matches: DataFrame) -> None:
+        path = self._matches_dir(competition_id, season_id) / f"{self._version_name(version)}.parquet"
+        self._write_frame(path, matches)
+        self._drop_other_versions(path)
+
+    def get_lineups(self, match_id: int, version: str) -> Dict[str, DataFrame] | None:
+        return self._read_frames(self.base_dir / "lineups" / str(match_id) / self._version_name(version))
+
+    def put_lineups(self, match_id: int, version: str, lineups: Dict[str, DataFrame]) -> None:
+        path = self.base_dir / "lineups" / str(match_id) / self._version_name(version)
+        self._write_frames(path, lineups)
+        self._drop_other_versions(path)
+
+    def get_split_match_events(self, match_id: int, version: str) -> Dict[str, DataFrame] | None:
+        return self._read_frames(self.base_dir / "events" / str(match_id) / self._version_name(version))
+
+    def put_split_match_events(self, match_id: int, version: str, split_events_dict: Dict[str, DataFrame]) -> None:
+        path = self.base_dir / "events" / str(match_id) / self._version_name(version)
+        self._write_frames(path, split_events_dict)
+        self._drop_other_versions(path)
+
+    def get_size(self) -> int:
+        if not self.base_dir.exists():
+            return 0
+        
+        return sum(file.stat().st_size for file in self.base_dir.rglob("*.parquet"))
+
+    def _matches_dir(self, competition_id: int, season_id: int) -> Path:
+        return self.base_dir / "matches" / str(competition_id) / str(season_id)
+
+    @staticmethod
+    def _version_name(version: str) -> str:
+        return quote(version, safe="") or "-"
+
+    def _drop_other_versions(self, path: Path) -> None:
+        if not path.exists():
+            return
+
+        for other in path.parent.iterdir():
+            if other == path or other.name.endswith(".tmp"):
+                continue
+            if other.is_dir():
+                shutil.rmtree(other, ignore_errors=True)
+            else:
+                other.unlink(missing_ok=True)
+
+    def _read_frame(self, path: Path) -> DataFrame | None:
+        if not path.exists():
+            return None
+
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            ParquetStore.logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_frame(self, path: Path, frame: DataFrame) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        except (ValueError, TypeError, NotImplementedError, OSError) as e:
+            # Disk full or not writable included, the data is still served
+            ParquetStore.logger.warning(f"Could not persist {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    # A frames dict is stored as one directory with one Parquet file per key,
+    # prefixed by its position to keep the dict order. The directory is built
+    # aside and renamed into place, so a reader sees the whole dict or nothing.
+    def _read_frames(self, path: Path) -> Dict[str, DataFrame] | None:
+        if not path.is_dir():
+            return None
+
+        try:
+            return {
+                unquote(file.stem.split("-", 1)[1]): pd.read_parquet(file)
+                for file in sorted(path.glob("*.parquet"))
+            }
+        except Exception as e:
+            ParquetStore.logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+
+    def _write_frames(self, path: Path, frames: Dict[str, DataFrame]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=path.parent, suffix=".tmp")
+
+        try:
+            for position, (name, frame) in enumerate(frames.items()):
+                frame.to_parquet(Path(tmp_dir) / f"{position:03d}-{quote(name, safe='')}.parquet", index=False)
+            os.replace(tmp_dir, path)
+        except (ValueError, TypeError, NotImplementedError) as e:
+            ParquetStore.logger.warning(f"Could not persist {path}: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        except OSError:
+            # Another writer stored the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -0,0 +1,133 @@
+import contextvars
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, TypeVar
+from pandas import DataFrame
+from repository.abstract_statsbomb_backend import AbstractStatsBombBackend
+from repository.circuit_breaker import CircuitBreaker
+
+T = TypeVar("T")
+
+
+class StatsBombUnavailableError(Exception):
+    pass
+
+
+# Wraps the backend the repository fetches from. Each call gets timeout
+# seconds, failed or timed out calls are retried with exponential backoff and
+# jitter, and a circuit breaker refuses calls right away while the upstream
+# keeps failing. A call takes at most about (retries + 1) * timeout plus the
+# backoff, then raises StatsBombUnavailableError. At most max_in_flight calls
+# run at once, a call waits up to queue_timeout for one of them to finish.
+# Calls made in background() (prefetching, revalidating) have a smaller budget
+# of their own, they never take the slots of the calls sessions wait on.
+class ResilientStatsBombBackend(AbstractStatsBombBackend):
+    logger = logging.getLogger(__name__)
+
+    # Retrying these gets the same answer
+    NON_RETRYABLE = (FileNotFoundError, KeyError, ValueError)
+
+    in_background: contextvars.ContextVar[bool] = contextvars.ContextVar("in_background", default=False)
+
+    def __init__(
+            self,
+            backend: AbstractStatsBombBackend,
+            timeout: float = 10.0,
+            retries: int = 2,
+            backoff: float = 0.5,
+            max_backoff: float = 5.0,
+            failure_threshold: int = 5,
+            reset_timeout: float = 30.0,
+            max_in_flight: int = 8,
+            max_background_in_flight: int = 2,
+            queue_timeout: float = 5.0
+        ) -> None:
+        self.backend = backend
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.circuit_breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.queue_timeout = queue_timeout
+        # A timed out call can't be interrupted: it keeps its thread and its
+        # slot here until the upstream answers, while the caller moves on
+        self.in_flight = threading.BoundedSemaphore(max_in_flight)
+        self.background_in_flight = threading.BoundedSemaphore(max_background_in_flight)
+
+    @staticmethod
+    @contextmanager
+    def background() -> Iterator[None]:
+        token = ResilientStatsBombBackend.in_background.set(True)
+        try:
+            yield
+        finally:
+            ResilientStatsBombBackend.in_background.reset(token)
+
+    def competitions(self) -> DataFrame:
+        return self._call("competitions", self.backend.competitions)
+
+    def matches(self, competition_id: int, season_id: int) -> DataFrame:
+        return self._call(f"matches {competition_id}/{season_id}", lambda: self.backend.matches(competition_id, season_id))
+
+    def lineups(self, match_id: int) -> Dict[str, DataFrame]:
+        return self._call(f"lineups {match_id}", lambda: self.backend.lineups(match_id))
+
+    def events(self, match_id: int) -> Dict[str, DataFrame]:
+        return self._call(f"events {match_id}", lambda: self.backend.events(match_id))
+
+    def _call(self, name: str, fetch: Callable[[], T]) -> T:
+        in_flight = self.background_in_flight if ResilientStatsBombBackend.in_background.get() else self.in_flight
+
+        for attempt in range(self.retries + 1):
+            # The slot first, a half open circuit lets a single trial call through
+            if not in_flight.acquire(timeout=self.queue_timeout):
+                raise StatsBombUnavailableError(f"No StatsBomb call finished within {self.queue_timeout:.1f}s, not fetching {name}")
+
+            if not self.circuit_breaker.allow_request():
+                in_flight.release()
+                raise StatsBombUnavailableError(f"StatsBomb circuit open, not fetching {name}")
+
+            try:
+                result = self._start(name, fetch, in_flight).result(timeout=self.timeout)
+            except ResilientStatsBombBackend.NON_RETRYABLE:
+                # The upstream answered, it isn't failing
+                self.circuit_breaker.record_success()
+                raise
+            except TimeoutError:
+                self.circuit_breaker.record_failure()
+                error = f"timed out after {self.timeout:.1f}s"
+            except Exception as e:
+                self.circuit_breaker.record_failure()
+                error = f"{type(e).__name__}: {e}"
+            else:
+                self.circuit_breaker.record_success()
+                return result
+
+            ResilientStatsBombBackend.logger.warning(f"Fetching {name} failed (attempt {attempt + 1}/{self.retries + 1}): {error}")
+
+            if attempt < self.retries:
+                delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+                time.sleep(random.uniform(delay / 2, delay))
+
+        raise StatsBombUnavailableError(f"Fetching {name} failed: {error}")
+
+    # Runs the fetch in a thread of its own, which releases the in-flight slot
+    # taken for it once the fetch returns, however late that is
+    def _start(self, name: str, fetch: Callable[[], T], in_flight: threading.BoundedSemaphore) -> Future:
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def run() -> None:
+            try:
+                future.set_result(fetch())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                in_flight.release()
+
+        threading.Thread(target=run, name=f"statsbomb-fetch {name}", daemon=True).start()
+        return future
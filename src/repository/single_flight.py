@@ -0,0 +1,64 @@
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class FetchAbandonedError(Exception):
+    pass
+
+
+# Coalesces concurrent calls for the same key: the first caller runs the fetch,
+# the ones arriving while it runs wait for it and get the very same result (or
+# exception). When the leader is interrupted instead, one of the waiters runs
+# the fetch again. Nothing is kept once the fetch is done, caching is up to the caller.
+class SingleFlight:
+    logger = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self.calls: Dict[Hashable, Future] = {}
+        self.lock = threading.Lock()
+
+    def do(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        while True:
+            with self.lock:
+                future = self.calls.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = Future()
+                    self.calls[key] = future
+
+            if is_leader:
+                return self._lead(key, future, fetch)
+
+            SingleFlight.logger.debug(f"Joining the in-flight fetch of {key}")
+            try:
+                return future.result()
+            except FetchAbandonedError:
+                # The first waiter to get here fetches, the others join it
+                continue
+
+    def _lead(self, key: Hashable, future: Future, fetch: Callable[[], T]) -> T:
+        try:
+            result = fetch()
+        except Exception as e:
+            self._forget(key)
+            future.set_exception(e)
+            raise
+        except BaseException:
+            # Interrupts and Streamlit's stop/rerun of the leader's script are
+            # the leader's own, they go on up its stack only
+            self._forget(key)
+            future.set_exception(FetchAbandonedError(f"The fetch of {key} was interrupted"))
+            raise
+
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    # Before the waiters wake up, so that a retrying one starts a new fetch
+    def _forget(self, key: Hashable) -> None:
+        with self.lock:
+            del self.calls[key]
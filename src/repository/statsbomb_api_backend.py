@@ -0,0 +1,18 @@
+from typing import Dict
+from pandas import DataFrame
+from statsbombpy import sb
+from repository.abstract_statsbomb_backend import AbstractStatsBombBackend
+
+class StatsBombApiBackend(AbstractStatsBombBackend):
+    
+    def competitions(self) -> DataFrame:
+        return sb.competitions()
+    
+    def matches(self, competition_id: int, season_id: int) -> DataFrame:
+        return sb.matches(competition_id, season_id)
+    
+    def lineups(self, match_id: int) -> Dict[str, DataFrame]:
+        return sb.lineups(match_id)
+    
+    def events(self, match_id: int) -> Dict[str, DataFrame]:
+        return sb.events(match_id=match_id, split=True, flatten_attrs=True)
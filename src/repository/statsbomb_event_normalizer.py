@@ -0,0 +1,77 @@
+from typing import Dict
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+# Compacts the frames statsbombpy builds: repeated strings become categoricals,
+# [x, y] lists become float32 columns and ids and counters small integers.
+class StatsBombEventNormalizer:
+    END_LOCATION_COLUMNS = [
+        "pass_end_location",
+        "carry_end_location",
+        "shot_end_location",
+        "goalkeeper_end_location",
+    ]
+    INTEGER_COLUMNS = ["index", "period", "minute", "second", "possession", "match_id"]
+    CATEGORY_MAX_RATIO = 0.5
+
+    @staticmethod
+    def normalize(split_events_dict: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        return {
+            event_name: StatsBombEventNormalizer.normalize_events(event_df)
+            for event_name, event_df in split_events_dict.items()
+        }
+
+    @staticmethod
+    def normalize_events(events: DataFrame) -> DataFrame:
+        events = events.copy()
+
+        if "location" in events.columns:
+            start = StatsBombEventNormalizer.split_points(events.pop("location"), 2)
+            events["x"] = start[:, 0]
+            events["y"] = start[:, 1]
+
+        for column in StatsBombEventNormalizer.END_LOCATION_COLUMNS:
+            if column not in events.columns:
+                continue
+            end = StatsBombEventNormalizer.split_points(events.pop(column), 3)
+            events["end_x"] = end[:, 0]
+            events["end_y"] = end[:, 1]
+            if column == "shot_end_location":
+                events["end_z"] = end[:, 2]
+
+        for column in events.columns:
+            series = events[column]
+
+            if column.endswith("_id") or column in StatsBombEventNormalizer.INTEGER_COLUMNS:
+                if pd.api.types.is_numeric_dtype(series):
+                    events[column] = StatsBombEventNormalizer.to_small_integer(series)
+            elif pd.api.types.is_float_dtype(series):
+                events[column] = series.astype(np.float32)
+            elif StatsBombEventNormalizer.is_repeated_string(series):
+                events[column] = series.astype("category")
+
+        return events
+
+    @staticmethod
+    def split_points(points: pd.Series, width: int) -> np.ndarray:
+        coords = np.full((len(points), width), np.nan, dtype=np.float32)
+
+        for row, point in enumerate(points):
+            if isinstance(point, (list, tuple, np.ndarray)):
+                coords[row, :min(len(point), width)] = point[:width]
+
+        return coords
+
+    @staticmethod
+    def to_small_integer(series: pd.Series) -> pd.Series:
+        if series.isna().any():
+            return series.astype("Int32")
+        return pd.to_numeric(series, downcast="integer")
+
+    @staticmethod
+    def is_repeated_string(series: pd.Series) -> bool:
+        if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.infer_dtype(series, skipna=True) != "string":
+            return False
+        return series.nunique() <= StatsBombEventNormalizer.CATEGORY_MAX_RATIO * len(series)
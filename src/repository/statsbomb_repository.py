@@ -1,132 +1,407 @@
-from typing import Dict, Literal, Tuple
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Literal, Set, Tuple
 from pandas import DataFrame
+import numpy as np
 import pandas as pd
-from statsbombpy import sb
 
 from enums.match_event import MatchEvent
+from monitoring.render_tracer import RenderTracer
+from repository.abstract_statsbomb_backend import AbstractStatsBombBackend
+from repository.competition_catalog import CompetitionCatalog
+from repository.match_index import MatchIndex
+from repository.parquet_store import ParquetStore
+from repository.resilient_backend import ResilientStatsBombBackend
+from repository.single_flight import SingleFlight
+from repository.statsbomb_event_normalizer import StatsBombEventNormalizer
 
 class StatsBombRepository:
-    def __init__(self):
-        pass
+    logger = logging.getLogger(__name__)
+    
+    def __init__(
+            self,
+            statsbomb_backend: AbstractStatsBombBackend,
+            parquet_store: ParquetStore | None = None,
+            competitions_ttl: int = 600,
+            stale_while_revalidate: bool = True
+        ):
+        self.statsbomb_backend = statsbomb_backend
+        self.parquet_store = parquet_store
+        self.competitions_ttl = competitions_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        # Seasons are cached with the version they were fetched at, matches
+        # with their last_updated
+        self.matches_cache: Dict[Tuple[int, int], Tuple[str, DataFrame]] = {}
+        self.match_index_cache: Dict[Tuple[int, int], MatchIndex] = {}
+        self.match_versions: Dict[int, str] = {}
+        self.matches_lock = threading.Lock()
+        self.catalog: CompetitionCatalog | None = None
+        self.catalog_built_at = 0.0
+        self.catalog_lock = threading.Lock()
+        # Sessions opening the same data at once share one fetch of it
+        self.single_flight = SingleFlight()
+        self.revalidating: Set[Hashable] = set()
+        self.revalidate_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="revalidate")
 
+    @RenderTracer.traced()
     def get_competitions(self) -> DataFrame:
-        return sb.competitions()
+        return self.single_flight.do("competitions", self._load_competitions)
+    
+    def _load_competitions(self) -> DataFrame:
+        if self.parquet_store is None:
+            return self.statsbomb_backend.competitions()
+        
+        competitions = self.parquet_store.get_competitions()
+        
+        if competitions is None:
+            competitions = self.statsbomb_backend.competitions()
+            self.parquet_store.put_competitions(competitions)
+            
+        return competitions
+    
+    # Refreshed every competitions_ttl seconds, the only data polled for
+    # changes: the seasons' versions in it decide what else is fetched again.
+    # The refresh runs in the background, sessions keep the current catalog
+    # meanwhile, and keep it if the refresh fails.
+    @RenderTracer.traced()
+    def get_catalog(self) -> CompetitionCatalog:
+        with self.catalog_lock:
+            if self.catalog is None:
+                self._build_catalog()
+                
+            catalog = self.catalog
+            expired = time.monotonic() - self.catalog_built_at > self.competitions_ttl
+        
+        if expired and self.stale_while_revalidate:
+            self._revalidate("catalog", self._refresh_catalog)
+        elif expired:
+            self._refresh_catalog()
+            catalog = self.catalog
+            
+        return catalog
+    
+    def _build_catalog(self) -> None:
+        stale_competitions = None
+        if self.parquet_store is not None and self.stale_while_revalidate:
+            stale_competitions = self.parquet_store.get_competitions(allow_stale=True)
+        
+        if stale_competitions is not None and self.parquet_store.get_competitions() is None:
+            # Past its ttl: served right away, refreshed on the next call
+            self.catalog = CompetitionCatalog(stale_competitions)
+            self.catalog_built_at = float("-inf")
+        else:
+            self.catalog = CompetitionCatalog(self.get_competitions())
+            self.catalog_built_at = time.monotonic()
     
+    def _refresh_catalog(self) -> None:
+        catalog = CompetitionCatalog(self.get_competitions())
+        
+        with self.catalog_lock:
+            self.catalog = catalog
+            self.catalog_built_at = time.monotonic()
+    
+    # The version of the season's data being served. Once the catalog has a
+    # newer one, the season served so far is kept until the newer matches are
+    # fetched in the background, so the view's caches keyed on this version
+    # never mix the two.
+    def get_season_version(self, competition_id: int, season_id: int) -> str:
+        try:
+            version = self.get_catalog().get_season_by_ids(competition_id, season_id)["version"]
+        except KeyError:
+            version = ""
+        
+        if not self.stale_while_revalidate:
+            return version
+        
+        served = self._get_served_matches(competition_id, season_id)
+        if served is None or served[0] == version:
+            return version
+        
+        self._revalidate(
+            ("matches", competition_id, season_id),
+            lambda: self._fetch_season_matches(competition_id, season_id, version)
+        )
+        return served[0]
+    
+    # Known once the match's season has been loaded
+    def get_match_version(self, match_id: int) -> str:
+        with self.matches_lock:
+            return self.match_versions.get(int(match_id), "")
+    
+    @RenderTracer.traced()
     def get_matches(
             self,
             competition_name: str,
-            season_name: str,
-            competition: DataFrame | None = None
+            season_name: str
+        ) -> DataFrame:
+        
+        competition_id, season_id = self.get_catalog().get_season_ids(competition_name, season_name)
+        
+        return self.get_season_matches(competition_id, season_id)
+    
+    @RenderTracer.traced()
+    def get_season_matches(
+            self,
+            competition_id: int,
+            season_id: int
         ) -> DataFrame:
         
-        if competition is None:
-            competition = self.get_competition(competition_name)
+        key = (competition_id, season_id)
+        version = self.get_season_version(competition_id, season_id)
         
-        season_competitions = competition[competition["season_name"] == season_name]
+        with self.matches_lock:
+            if key in self.matches_cache and self.matches_cache[key][0] == version:
+                return self.matches_cache[key][1]
         
-        return sb.matches(
-            season_competitions["competition_id"].values[0],
-            season_competitions["season_id"].values[0]
+        return self._fetch_season_matches(competition_id, season_id, version)
+    
+    def _fetch_season_matches(self, competition_id: int, season_id: int, version: str) -> DataFrame:
+        return self.single_flight.do(
+            ("matches", competition_id, season_id, version),
+            lambda: self._load_season_matches(competition_id, season_id, version)
         )
     
+    def _load_season_matches(self, competition_id: int, season_id: int, version: str) -> DataFrame:
+        key = (competition_id, season_id)
+        
+        with self.matches_lock:
+            # Stored by a fetch that finished just before this one started
+            if key in self.matches_cache and self.matches_cache[key][0] == version:
+                return self.matches_cache[key][1]
+        
+        matches = self.parquet_store.get_matches(competition_id, season_id, version) if self.parquet_store else None
+        
+        if matches is None:
+            matches = self.statsbomb_backend.matches(competition_id, season_id)
+            if self.parquet_store is not None:
+                self.parquet_store.put_matches(competition_id, season_id, version, matches)
+        
+        self._put_season_matches(competition_id, season_id, version, matches)
+        
+        return matches
+    
+    # Whichever version of the season is in memory, or else on disk
+    def _get_served_matches(self, competition_id: int, season_id: int) -> Tuple[str, DataFrame] | None:
+        with self.matches_lock:
+            if (competition_id, season_id) in self.matches_cache:
+                return self.matches_cache[(competition_id, season_id)]
+        
+        if self.parquet_store is None:
+            return None
+        
+        return self.single_flight.do(
+            ("stored matches", competition_id, season_id),
+            lambda: self._load_stored_matches(competition_id, season_id)
+        )
+    
+    def _load_stored_matches(self, competition_id: int, season_id: int) -> Tuple[str, DataFrame] | None:
+        with self.matches_lock:
+            if (competition_id, season_id) in self.matches_cache:
+                return self.matches_cache[(competition_id, season_id)]
+        
+        stored = self.parquet_store.get_latest_matches(competition_id, season_id)
+        
+        if stored is not None:
+            self._put_season_matches(competition_id, season_id, *stored)
+            
+        return stored
+    
+    def _put_season_matches(self, competition_id: int, season_id: int, version: str, matches: DataFrame) -> None:
+        match_ids = matches["match_id"].astype(int).tolist()
+        if "last_updated" in matches.columns:
+            match_versions = matches["last_updated"].fillna("").astype(str).tolist()
+        else:
+            match_versions = [version] * len(match_ids)
+        
+        with self.matches_lock:
+            self.matches_cache[(competition_id, season_id)] = (version, matches)
+            self.match_versions.update(zip(match_ids, match_versions))
+    
+    # One background refresh per key at a time, a failed one is retried by the
+    # next call still finding the data outdated
+    def _revalidate(self, key: Hashable, refresh: Callable[[], object]) -> None:
+        with self.matches_lock:
+            if key in self.revalidating:
+                return
+            self.revalidating.add(key)
+        
+        def run() -> None:
+            try:
+                with ResilientStatsBombBackend.background():
+                    refresh()
+            except Exception as e:
+                StatsBombRepository.logger.warning(f"Refreshing {key} failed, serving the cached copy: {e}")
+            finally:
+                with self.matches_lock:
+                    self.revalidating.discard(key)
+        
+        self.revalidate_executor.submit(run)
+    
+    @RenderTracer.traced()
     def get_team_lineup(
             self,
             match_id: int,
             team_name: str
         ) -> DataFrame:
         
-        return sb.lineups(match_id)[team_name]
+        return self.get_lineups(match_id)[team_name]
     
-    def get_match_events(
+    @RenderTracer.traced()
+    def get_lineups(
             self,
             match_id: int
-        ) -> DataFrame:
+        ) -> Dict[str, DataFrame]:
+        
+        version = self.get_match_version(match_id)
         
-        return sb.events(match_id)
+        return self.single_flight.do(
+            ("lineups", int(match_id), version),
+            lambda: self._load_lineups(match_id, version)
+        )
     
+    def _load_lineups(self, match_id: int, version: str) -> Dict[str, DataFrame]:
+        if self.parquet_store is None:
+            return self.statsbomb_backend.lineups(match_id)
+        
+        lineups = self.parquet_store.get_lineups(match_id, version)
+        
+        if lineups is None:
+            lineups = self.statsbomb_backend.lineups(match_id)
+            self.parquet_store.put_lineups(match_id, version, lineups)
+            
+        return lineups
+    
+    @RenderTracer.traced()
     def get_split_match_events(
             self,
             match_id: int
         ) -> Dict[str, DataFrame]:
         
-        return sb.events(match_id=match_id, split=True, flatten_attrs=True)   
+        version = self.get_match_version(match_id)
+        
+        return self.single_flight.do(
+            ("events", int(match_id), version),
+            lambda: self._load_split_match_events(match_id, version)
+        )
     
-    def get_team_match_info(
+    def _load_split_match_events(self, match_id: int, version: str) -> Dict[str, DataFrame]:
+        if self.parquet_store is None:
+            return StatsBombEventNormalizer.normalize(self.statsbomb_backend.events(match_id))
+        
+        split_events_dict = self.parquet_store.get_split_match_events(match_id, version)
+        
+        if split_events_dict is None:
+            split_events_dict = StatsBombEventNormalizer.normalize(self.statsbomb_backend.events(match_id))
+            self.parquet_store.put_split_match_events(match_id, version, split_events_dict)
+            
+        return split_events_dict
+    
+    @RenderTracer.traced()
+    def get_match_index(
             self,
-            team_matches: DataFrame,
-            match_option: str
-        ) -> Tuple[Dict, DataFrame]:
+            competition_id: int,
+            season_id: int
+        ) -> MatchIndex:
         
-        match_id = team_matches[team_matches["match_option"] == match_option]["match_id"].values[0]
+        key = (competition_id, season_id)
+        matches = self.get_season_matches(competition_id, season_id)
         
-        match = team_matches[team_matches["match_id"] == match_id]
+        with self.matches_lock:
+            # Rebuilt once the season's matches were fetched again
+            if key in self.match_index_cache and self.match_index_cache[key].matches is matches:
+                return self.match_index_cache[key]
         
-        return {
-            "match_id": int(match_id),
-            "match_date": match["match_date"].values[0],
-            "home_team": match["home_team"].values[0],
-            "away_team": match["away_team"].values[0],
-            "home_score": int(match["home_score"].values[0]),
-            "away_score": int(match["away_score"].values[0]),
-            "competition_stage": match["competition_stage"].values[0],
-            "stadium": match["stadium"].values[0],
-        }, match
-        
-    def get_team_matches_info(
-            self,
-            team_name: str,
-            team_matches: DataFrame
-        ) -> Dict:
-        
-        total_wins = 0
-        total_losses = 0
-        total_draws = 0
-        total_goals_scored = 0
-        total_goals_conceded = 0
-        total_home_games = 0
-        total_away_games = 0
-        
-        for _, match in team_matches.iterrows():
-            if match['home_team'] == team_name:
-                total_home_games += 1
-                total_goals_scored += match['home_score']
-                total_goals_conceded += match['away_score']
-                if match['home_score'] > match['away_score']:
-                    total_wins += 1
-                elif match['home_score'] < match['away_score']:
-                    total_losses += 1
-                else:
-                    total_draws += 1
-            elif match['away_team'] == team_name:
-                total_away_games += 1
-                total_goals_scored += match['away_score']
-                total_goals_conceded += match['home_score']
-                if match['away_score'] > match['home_score']:
-                    total_wins += 1
-                elif match['away_score'] < match['home_score']:
-                    total_losses += 1
-                else:
-                    total_draws += 1
-                
-        total_matches = len(team_matches)
-        average_goals_scored = total_goals_scored / total_matches if total_matches > 0 else 0
-        average_goals_conceded = total_goals_conceded / total_matches if total_matches > 0 else 0
+        match_index = MatchIndex(matches)
+        
+        with self.matches_lock:
+            self.match_index_cache[key] = match_index
+            
+        return match_index
+        
+    @RenderTracer.traced()
+    def get_season_teams_info(self, matches: DataFrame) -> DataFrame:
+        home_score = matches["home_score"].to_numpy()
+        away_score = matches["away_score"].to_numpy()
+        
+        # One row per (match, team) with the score seen from that team's side
+        games = DataFrame({
+            "team_name": np.concatenate([matches["home_team"].to_numpy(), matches["away_team"].to_numpy()]),
+            "stadium": np.concatenate([matches["stadium"].to_numpy(), matches["stadium"].to_numpy()]),
+            "goals_scored": np.concatenate([home_score, away_score]),
+            "goals_conceded": np.concatenate([away_score, home_score]),
+            "is_home": np.repeat([True, False], len(matches)),
+            "order": np.tile(np.arange(len(matches)), 2),
+        }).sort_values("order", kind="stable")
+        
+        is_away = ~games["is_home"]
+        games["win"] = games["goals_scored"] > games["goals_conceded"]
+        games["loss"] = games["goals_scored"] < games["goals_conceded"]
+        games["draw"] = ~(games["win"] | games["loss"])
+        games["home_win"] = games["win"] & games["is_home"]
+        games["home_loss"] = games["loss"] & games["is_home"]
+        games["home_draw"] = games["draw"] & games["is_home"]
+        games["away_win"] = games["win"] & is_away
+        games["away_loss"] = games["loss"] & is_away
+        games["away_draw"] = games["draw"] & is_away
+        games["is_away"] = is_away
+        
+        teams_info = games.groupby("team_name", sort=False).agg(
+            stadium=("stadium", "first"),
+            total_matches=("order", "size"),
+            total_wins=("win", "sum"),
+            total_losses=("loss", "sum"),
+            total_draws=("draw", "sum"),
+            total_goals_scored=("goals_scored", "sum"),
+            total_goals_conceded=("goals_conceded", "sum"),
+            total_home_games=("is_home", "sum"),
+            total_away_games=("is_away", "sum"),
+            home_wins=("home_win", "sum"),
+            home_losses=("home_loss", "sum"),
+            home_draws=("home_draw", "sum"),
+            away_wins=("away_win", "sum"),
+            away_losses=("away_loss", "sum"),
+            away_draws=("away_draw", "sum"),
+        )
+        
+        teams_info["average_goals_scored"] = teams_info["total_goals_scored"] / teams_info["total_matches"]
+        teams_info["average_goals_conceded"] = teams_info["total_goals_conceded"] / teams_info["total_matches"]
+        teams_info["goal_difference"] = teams_info["total_goals_scored"] - teams_info["total_goals_conceded"]
+        teams_info["points"] = 3 * teams_info["total_wins"] + teams_info["total_draws"]
+        
+        return teams_info.sort_values(
+            ["points", "goal_difference", "total_goals_scored"],
+            ascending=False,
+            kind="stable"
+        )
+    
+    @RenderTracer.traced()
+    def get_team_info(self, teams_info: DataFrame, team_name: str) -> Dict:
+        team = teams_info.loc[team_name]
         
         return {
-            "stadium": team_matches["stadium"].values[0],
+            "stadium": team["stadium"],
             "team_name": team_name,
-            "total_matches": total_matches,
-            "total_wins": total_wins,
-            "total_losses": total_losses,
-            "total_draws": total_draws,
-            "total_goals_scored": total_goals_scored,
-            "total_goals_conceded": total_goals_conceded,
-            "average_goals_scored": average_goals_scored,
-            "average_goals_conceded": average_goals_conceded,
-            "total_home_games": total_home_games,
-            "total_away_games": total_away_games
+            "total_matches": int(team["total_matches"]),
+            "total_wins": int(team["total_wins"]),
+            "total_losses": int(team["total_losses"]),
+            "total_draws": int(team["total_draws"]),
+            "total_goals_scored": int(team["total_goals_scored"]),
+            "total_goals_conceded": int(team["total_goals_conceded"]),
+            "average_goals_scored": float(team["average_goals_scored"]),
+            "average_goals_conceded": float(team["average_goals_conceded"]),
+            "total_home_games": int(team["total_home_games"]),
+            "total_away_games": int(team["total_away_games"]),
+            "home_wins": int(team["home_wins"]),
+            "home_losses": int(team["home_losses"]),
+            "home_draws": int(team["home_draws"]),
+            "away_wins": int(team["away_wins"]),
+            "away_losses": int(team["away_losses"]),
+            "away_draws": int(team["away_draws"]),
         }
     
+    @RenderTracer.traced()
     def get_match_events_info(self, split_events_dict: Dict[str, DataFrame]) -> Dict:
         return {
             "total_passes": len(split_events_dict[MatchEvent.PASSES.value]),
@@ -136,25 +411,43 @@ class StatsBombRepository:
             "total_duels": len(split_events_dict[MatchEvent.DUELS.value]),
         }
         
-    def get_player_events_info(self, player_name: str, split_events_dict: Dict[str, pd.DataFrame]) -> Dict:
-        player_events = {
-            MatchEvent.PASSES.value: 0,
-            MatchEvent.SHOTS.value: 0,
-            MatchEvent.DRIBBLES.value: 0,
-            MatchEvent.BLOCKS.value: 0,
-            MatchEvent.DUELS.value: 0,
-        }
+    @RenderTracer.traced()
+    def get_event_count_matrix(
+            self,
+            split_events_dict: Dict[str, DataFrame],
+            by: Literal["player", "team"]
+        ) -> DataFrame:
+        
+        actors = [
+            DataFrame({by: event_df[by].to_numpy(), "event": event_name})
+            for event_name, event_df in split_events_dict.items()
+            if by in event_df.columns
+        ]
         
-        for event_name, event_df in split_events_dict.items():
-            if "player" not in event_df.columns:
-                continue
-            player_event_df = event_df[event_df["player"] == player_name]
-            player_events[event_name] = len(player_event_df)
+        # No events name a player or team, e.g. a match without event data
+        if not actors:
+            return DataFrame(
+                index=pd.Index([], name=by),
+                columns=pd.Index([], name="event"),
+                dtype=np.int64
+            )
+        
+        return pd.concat(actors, ignore_index=True).groupby([by, "event"], sort=False).size().unstack(fill_value=0)
+    
+    @RenderTracer.traced()
+    def get_player_events_info(self, player_name: str, player_event_counts: DataFrame) -> Dict:
+        if player_name in player_event_counts.index:
+            player_events = player_event_counts.loc[player_name]
+        else:
+            player_events = pd.Series(dtype=int)
+        
+        def count(event: MatchEvent) -> int:
+            return int(player_events.get(event.value, 0))
         
         return {
-            "total_passes": player_events[MatchEvent.PASSES.value],
-            "total_shots": player_events[MatchEvent.SHOTS.value],
-            "total_dribbles": player_events[MatchEvent.DRIBBLES.value],
-            "total_blocks": player_events[MatchEvent.BLOCKS.value],
-            "total_duels": player_events[MatchEvent.DUELS.value],
-        }
\ No newline at end of file
+            "total_passes": count(MatchEvent.PASSES),
+            "total_shots": count(MatchEvent.SHOTS),
+            "total_dribbles": count(MatchEvent.DRIBBLES),
+            "total_blocks": count(MatchEvent.BLOCKS),
+            "total_duels": count(MatchEvent.DUELS),
+        }
@@ -0,0 +1,299 @@
+import math
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from enums.view_strategy import ViewStrategy
+from repository.local_open_data_backend import LocalOpenDataBackend
+
+
+# Generates StatsBomb open data files instead of reading them, so the whole
+# pipeline (statsbombpy frame building, normalization, Parquet store, views)
+# runs at any volume. Every file is a pure function of its path and the seed:
+# the same match always has the same teams, lineups and events.
+class SyntheticOpenDataBackend(LocalOpenDataBackend):
+    MATCH_ID_BASE = 9_000_000
+    SEASON_ID_BASE = 900
+    TEAMS_PER_SEASON = 20
+    PLAYERS_PER_TEAM = 16
+
+    # (type id, type name, share of the events)
+    EVENT_TYPES = [
+        (30, "Pass", 0.30),
+        (42, "Ball Receipt*", 0.28),
+        (43, "Carry", 0.23),
+        (17, "Pressure", 0.08),
+        (2, "Ball Recovery", 0.03),
+        (4, "Duel", 0.02),
+        (9, "Clearance", 0.015),
+        (14, "Dribble", 0.01),
+        (6, "Block", 0.01),
+        (16, "Shot", 0.01),
+        (10, "Interception", 0.005),
+        (22, "Foul Committed", 0.005),
+        (21, "Foul Won", 0.005),
+    ]
+    PASS_OUTCOMES = [(9, "Incomplete"), (75, "Out"), (76, "Pass Offside"), (77, "Unknown")]
+    SHOT_OUTCOMES = [(97, "Goal"), (100, "Saved"), (96, "Blocked"), (98, "Off T"), (101, "Wayward"), (99, "Post")]
+    POSITIONS = [
+        (1, "Goalkeeper"), (2, "Right Back"), (3, "Right Center Back"), (5, "Left Center Back"), (6, "Left Back"),
+        (10, "Center Defensive Midfield"), (13, "Right Center Midfield"), (15, "Left Center Midfield"),
+        (17, "Right Wing"), (21, "Left Wing"), (23, "Center Forward"),
+    ]
+
+    def __init__(
+            self,
+            n_matches: int = 10_000,
+            events_per_match: int = 3500,
+            seasons_per_competition: int = 5,
+            seed: int = 0
+        ) -> None:
+        super().__init__("synthetic")
+        self.events_per_match = events_per_match
+        self.seed = seed
+        self.competitions_list = [
+            (category, name)
+            for category in ViewStrategy
+            for name in category.get_competitions_list()
+        ]
+        self.seasons = [
+            (competition_index, season_index)
+            for competition_index in range(len(self.competitions_list))
+            for season_index in range(seasons_per_competition)
+        ]
+        self.matches_per_season = max(1, math.ceil(n_matches / len(self.seasons)))
+        self.season_fixtures = lru_cache(maxsize=64)(self._season_fixtures)
+
+    def build_json(self, relative_path: str) -> Any:
+        parts = relative_path.removesuffix(".json").split("/")
+
+        if parts[0] == "competitions":
+            return self.build_competitions()
+        if parts[0] == "matches":
+            return self.build_matches(int(parts[1]), int(parts[2]))
+        if parts[0] == "lineups":
+            return self.build_lineups(int(parts[1]))
+        if parts[0] == "events":
+            return self.build_events(int(parts[1]))
+
+        raise FileNotFoundError(f"StatsBomb open data file not found: {relative_path}")
+
+    def get_match_ids(self) -> List[int]:
+        return list(range(
+            SyntheticOpenDataBackend.MATCH_ID_BASE,
+            SyntheticOpenDataBackend.MATCH_ID_BASE + len(self.seasons) * self.matches_per_season
+        ))
+
+    def build_competitions(self) -> List[Dict]:
+        competitions = []
+
+        for season_position, (competition_index, season_index) in enumerate(self.seasons):
+            category, competition_name = self.competitions_list[competition_index]
+            updated = f"{2024 - season_index}-07-01T00:00:00.000"
+            competitions.append({
+                "competition_id": competition_index + 1,
+                "season_id": SyntheticOpenDataBackend.SEASON_ID_BASE + season_position,
+                "country_name": self._country_name(category, competition_index),
+                "competition_name": competition_name,
+                "competition_gender": "male",
+                "competition_youth": False,
+                "competition_international": category != ViewStrategy.NATIONAL_COMPETITIONS,
+                "season_name": self._season_name(category, season_index),
+                "match_updated": updated,
+                "match_updated_360": None,
+                "match_available_360": None,
+                "match_available": updated,
+            })
+
+        return competitions
+
+    def build_matches(self, competition_id: int, season_id: int) -> List[Dict]:
+        season_position = season_id - SyntheticOpenDataBackend.SEASON_ID_BASE
+
+        if not 0 <= season_position < len(self.seasons) or self.seasons[season_position][0] != competition_id - 1:
+            raise FileNotFoundError(f"StatsBomb open data file not found: matches/{competition_id}/{season_id}.json")
+
+        competition_index, season_index = self.seasons[season_position]
+        category, competition_name = self.competitions_list[competition_index]
+        country_name = self._country_name(category, competition_index)
+        season_name = self._season_name(category, season_index)
+        first_day = date(2024 - season_index, 8, 1)
+        matches = []
+
+        for match_index, (home, away, home_score, away_score) in enumerate(self.season_fixtures(season_position)):
+            home_team, away_team = self._team(season_position, home), self._team(season_position, away)
+            matches.append({
+                "match_id": self._match_id(season_position, match_index),
+                "match_date": (first_day + timedelta(days=match_index * 280 // self.matches_per_season)).isoformat(),
+                "kick_off": "20:00:00.000",
+                "competition": {"competition_id": competition_id, "country_name": country_name, "competition_name": competition_name},
+                "season": {"season_id": season_id, "season_name": season_name},
+                "home_team": {
+                    "home_team_id": home_team[0],
+                    "home_team_name": home_team[1],
+                    "home_team_gender": "male",
+                    "managers": [{"id": home_team[0], "name": f"{home_team[1]} Manager"}],
+                },
+                "away_team": {
+                    "away_team_id": away_team[0],
+                    "away_team_name": away_team[1],
+                    "away_team_gender": "male",
+                    "managers": [{"id": away_team[0], "name": f"{away_team[1]} Manager"}],
+                },
+                "home_score": home_score,
+                "away_score": away_score,
+                "match_status": "available",
+                "match_status_360": "unscheduled",
+                "last_updated": f"{first_day.year + 1}-06-01T00:00:00.000",
+                "last_updated_360": None,
+                "metadata": {"data_version": "1.1.0", "shot_fidelity_version": "2", "xy_fidelity_version": "2"},
+                "match_week": match_index * 38 // self.matches_per_season + 1,
+                "competition_stage": {"id": 1, "name": "Regular Season"},
+                "stadium": {"id": home_team[0], "name": f"{home_team[1]} Stadium"},
+                "referee": {"id": match_index % 30 + 1, "name": f"Referee {match_index % 30 + 1}"},
+            })
+
+        return matches
+
+    def build_lineups(self, match_id: int) -> List[Dict]:
+        season_position, home_team, away_team = self._match_teams(match_id)
+
+        return [
+            {
+                "team_id": team_id,
+                "team_name": team_name,
+                "lineup": [
+                    {
+                        "player_id": player_id,
+                        "player_name": player_name,
+                        "player_nickname": None,
+                        "jersey_number": number + 1,
+                        "country": {"id": 1, "name": "Synthetic"},
+                        "cards": [],
+                        "positions": [],
+                    }
+                    for number, (player_id, player_name) in enumerate(self._players(team_id, team_name))
+                ],
+            }
+            for team_id, team_name in (home_team, away_team)
+        ]
+
+    def build_events(self, match_id: int) -> List[Dict]:
+        _, home_team, away_team = self._match_teams(match_id)
+        rng = np.random.default_rng((self.seed, match_id))
+        n_events = self.events_per_match
+        teams = (home_team, away_team)
+        players = {team[0]: self._players(*team) for team in teams}
+
+        type_shares = np.array([share for _, _, share in SyntheticOpenDataBackend.EVENT_TYPES])
+        type_indexes = rng.choice(len(type_shares), n_events, p=type_shares / type_shares.sum())
+        # Every type shows up at least once, the views count passes, shots, duels...
+        type_indexes[:len(type_shares)] = np.arange(len(type_shares))
+        rng.shuffle(type_indexes)
+
+        team_sides = rng.integers(0, 2, n_events)
+        player_numbers = rng.integers(0, SyntheticOpenDataBackend.PLAYERS_PER_TEAM, n_events)
+        locations = np.round(np.column_stack([rng.uniform(0, 120, n_events), rng.uniform(0, 80, n_events)]), 1)
+        end_locations = np.round(np.column_stack([rng.uniform(0, 120, n_events), rng.uniform(0, 80, n_events)]), 1)
+        seconds = np.sort(rng.uniform(0, 95 * 60, n_events))
+        outcomes = rng.random(n_events)
+
+        events = []
+        for i in range(n_events):
+            type_id, type_name, _ = SyntheticOpenDataBackend.EVENT_TYPES[type_indexes[i]]
+            team_id, team_name = teams[team_sides[i]]
+            player_id, player_name = players[team_id][player_numbers[i]]
+            position_id, position_name = SyntheticOpenDataBackend.POSITIONS[player_numbers[i] % len(SyntheticOpenDataBackend.POSITIONS)]
+            second = int(seconds[i])
+            period = 1 if second < 47 * 60 else 2
+            event = {
+                "id": f"{match_id}-{i:05d}",
+                "index": i + 1,
+                "period": period,
+                "timestamp": f"00:{second // 60 % 60:02d}:{second % 60:02d}.000",
+                "minute": second // 60,
+                "second": second % 60,
+                "type": {"id": type_id, "name": type_name},
+                "possession": i // 8 + 1,
+                "possession_team": {"id": team_id, "name": team_name},
+                "play_pattern": {"id": 1, "name": "Regular Play"},
+                "team": {"id": team_id, "name": team_name},
+                "player": {"id": player_id, "name": player_name},
+                "position": {"id": position_id, "name": position_name},
+                "location": locations[i].tolist(),
+                "duration": round(float(outcomes[i]) * 2, 3),
+            }
+
+            if type_name == "Pass":
+                event["pass"] = {
+                    "length": round(float(np.hypot(*(end_locations[i] - locations[i]))), 1),
+                    "end_location": end_locations[i].tolist(),
+                }
+                if outcomes[i] < 0.2:
+                    outcome_id, outcome_name = SyntheticOpenDataBackend.PASS_OUTCOMES[int(outcomes[i] * 20) % 4]
+                    event["pass"]["outcome"] = {"id": outcome_id, "name": outcome_name}
+            elif type_name == "Carry":
+                event["carry"] = {"end_location": end_locations[i].tolist()}
+            elif type_name == "Shot":
+                # Shots go towards the goal the team attacks (x = 120)
+                event["location"] = [round(float(90 + locations[i][0] / 4), 1), round(float(20 + locations[i][1] / 2), 1)]
+                outcome_id, outcome_name = SyntheticOpenDataBackend.SHOT_OUTCOMES[int(outcomes[i] * 6)]
+                event["shot"] = {
+                    "end_location": [120.0, round(float(36 + outcomes[i] * 8), 1), round(float(outcomes[i] * 3), 1)],
+                    "outcome": {"id": outcome_id, "name": outcome_name},
+                    "statsbomb_xg": round(float(outcomes[i]) / 3, 3),
+                }
+
+            events.append(event)
+
+        return events
+
+    def _load_json(self, relative_path: str) -> Any:
+        return self.build_json(relative_path)
+
+    def _season_fixtures(self, season_position: int) -> List[Tuple[int, int, int, int]]:
+        rng = np.random.default_rng((self.seed, season_position))
+        n = self.matches_per_season
+        home = rng.integers(0, SyntheticOpenDataBackend.TEAMS_PER_SEASON, n)
+        away = (home + rng.integers(1, SyntheticOpenDataBackend.TEAMS_PER_SEASON, n)) % SyntheticOpenDataBackend.TEAMS_PER_SEASON
+        home_score = rng.poisson(1.5, n)
+        away_score = rng.poisson(1.1, n)
+
+        return list(zip(home.tolist(), away.tolist(), home_score.tolist(), away_score.tolist()))
+
+    def _match_teams(self, match_id: int) -> Tuple[int, Tuple[int, str], Tuple[int, str]]:
+        offset = match_id - SyntheticOpenDataBackend.MATCH_ID_BASE
+        season_position, match_index = divmod(offset, self.matches_per_season)
+
+        if offset < 0 or season_position >= len(self.seasons):
+            raise FileNotFoundError(f"StatsBomb open data file not found: match {match_id}")
+
+        home, away, _, _ = self.season_fixtures(season_position)[match_index]
+        return season_position, self._team(season_position, home), self._team(season_position, away)
+
+    def _match_id(self, season_position: int, match_index: int) -> int:
+        return SyntheticOpenDataBackend.MATCH_ID_BASE + season_position * self.matches_per_season + match_index
+
+    def _team(self, season_position: int, team_index: int) -> Tuple[int, str]:
+        competition_index = self.seasons[season_position][0]
+        return (
+            (competition_index + 1) * 100 + team_index,
+            f"{self.competitions_list[competition_index][1]} Team {team_index + 1:02d}"
+        )
+
+    def _players(self, team_id: int, team_name: str) -> List[Tuple[int, str]]:
+        return [
+            (team_id * 100 + number, f"{team_name} Player {number + 1:02d}")
+            for number in range(SyntheticOpenDataBackend.PLAYERS_PER_TEAM)
+        ]
+
+    def _country_name(self, category: ViewStrategy, competition_index: int) -> str:
+        if category == ViewStrategy.NATIONAL_COMPETITIONS:
+            return f"Country {competition_index + 1}"
+        return "International"
+
+    def _season_name(self, category: ViewStrategy, season_index: int) -> str:
+        year = 2024 - season_index
+        if category == ViewStrategy.NATIONAL_COMPETITIONS:
+            return f"{year - 1}/{year}"
+        return str(year)
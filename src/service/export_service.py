@@ -0,0 +1,91 @@
+import io
+import json
+import tempfile
+import zipfile
+from typing import Dict, IO, Iterable, Tuple
+from pandas import DataFrame
+
+
+# Serializes frames for the download buttons only when a download is asked
+# for. Frames are written in row chunks straight into the buffer handed to
+# st.download_button, so a large export is never also held as one big string.
+# Season archives are built in a temporary file that moves to disk past
+# SPOOL_MAX_BYTES.
+class ExportService:
+    FORMATS = {
+        "CSV": ("csv", "text/csv"),
+        "Parquet": ("parquet", "application/vnd.apache.parquet"),
+        "Arrow IPC": ("arrow", "application/vnd.apache.arrow.file"),
+    }
+    CHUNK_ROWS = 50_000
+    SPOOL_MAX_BYTES = 64 * 1024 ** 2
+
+    @staticmethod
+    def get_file_name(name: str, export_format: str) -> str:
+        return f"{name}.{ExportService.FORMATS[export_format][0]}"
+
+    @staticmethod
+    def get_mime(export_format: str) -> str:
+        return ExportService.FORMATS[export_format][1]
+
+    @staticmethod
+    def export_frame(frame: DataFrame, export_format: str) -> io.BytesIO:
+        file = io.BytesIO()
+        ExportService.write_frame(frame, export_format, file)
+        file.seek(0)
+        return file
+
+    @staticmethod
+    def export_json(data: Dict) -> io.BytesIO:
+        file = io.BytesIO()
+        file.write(json.dumps(data, ensure_ascii=False, indent=2).encode())
+        file.seek(0)
+        return file
+
+    # One file per (path, frame), the frames are pulled one at a time
+    @staticmethod
+    def export_archive(frames: Iterable[Tuple[str, DataFrame]], export_format: str) -> tempfile.SpooledTemporaryFile:
+        file = tempfile.SpooledTemporaryFile(max_size=ExportService.SPOOL_MAX_BYTES)
+        # Parquet and Arrow files are compressed already
+        compression = zipfile.ZIP_DEFLATED if export_format == "CSV" else zipfile.ZIP_STORED
+
+        with zipfile.ZipFile(file, "w", compression=compression) as archive:
+            for path, frame in frames:
+                with archive.open(ExportService.get_file_name(path, export_format), "w", force_zip64=True) as entry:
+                    ExportService.write_frame(frame, export_format, entry)
+
+        file.seek(0)
+        return file
+
+    @staticmethod
+    def write_frame(frame: DataFrame, export_format: str, file: IO[bytes]) -> None:
+        chunks = [
+            frame.iloc[start:start + ExportService.CHUNK_ROWS]
+            for start in range(0, max(len(frame), 1), ExportService.CHUNK_ROWS)
+        ]
+
+        if export_format == "CSV":
+            for position, chunk in enumerate(chunks):
+                file.write(chunk.to_csv(header=position == 0).encode())
+            return
+
+        if export_format not in ExportService.FORMATS:
+            raise ValueError(f"Unknown export format: {export_format}")
+
+        # Only loaded once a Parquet or Arrow export is asked for
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        import pyarrow.parquet as pq
+
+        try:
+            # From the whole frame: a column that is all null in the first chunk
+            # would be typed null and fail on the next ones
+            schema = pa.Schema.from_pandas(frame, preserve_index=False)
+            writer = pq.ParquetWriter(file, schema) if export_format == "Parquet" else ipc.new_file(file, schema)
+
+            with writer:
+                for chunk in chunks:
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        except (pa.ArrowException, TypeError) as e:
+            # Columns holding nested or mixed Python objects have no Arrow type
+            raise ValueError(f"Cannot write {export_format}: {e}") from e
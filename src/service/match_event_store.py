@@ -0,0 +1,97 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+from pandas import DataFrame
+from enums.match_event import MatchEvent
+from monitoring.render_tracer import RenderTracer
+from service.match_prefetch_service import MatchPrefetchService
+
+
+# Process-wide copy of the split events of the most recently used matches.
+# st.cache_data pickles a value on every hit, this store hands out the very same
+# frames to every session instead, so they are shared and must not be modified
+# in place. Matches are evicted least recently used first once the memory taken
+# by the frames exceeds max_bytes, and replaced once the match was updated.
+class MatchEventStore:
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+            self,
+            match_prefetch_service: MatchPrefetchService,
+            max_bytes: int = 512 * 1024 ** 2
+        ) -> None:
+        self.match_prefetch_service = match_prefetch_service
+        self.max_bytes = max_bytes
+        self.matches: OrderedDict[int, Tuple[Dict[str, DataFrame], int, str]] = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        # Read on every scrape or metrics file write
+        RenderTracer.MATCH_EVENT_STORE_BYTES.set_function(lambda: self.get_stats()["bytes"])
+        RenderTracer.MATCH_EVENT_STORE_MAX_BYTES.set_function(lambda: self.get_stats()["max_bytes"])
+        RenderTracer.MATCH_EVENT_STORE_MATCHES.set_function(lambda: self.get_stats()["matches"])
+
+    def get_split_match_events(self, match_id: int) -> Dict[str, DataFrame]:
+        match_id = int(match_id)
+        version = self.match_prefetch_service.get_match_version(match_id)
+
+        with self.lock:
+            if match_id in self.matches and self.matches[match_id][2] == version:
+                self.matches.move_to_end(match_id)
+                return self.matches[match_id][0]
+
+        split_events_dict = self.match_prefetch_service.get_split_match_events(match_id)
+        size = MatchEventStore.get_frames_size(split_events_dict)
+
+        with self.lock:
+            # Another session loaded the match meanwhile, keep the stored copy
+            if match_id in self.matches and self.matches[match_id][2] == version:
+                self.matches.move_to_end(match_id)
+                return self.matches[match_id][0]
+
+            if match_id in self.matches:
+                self.total_bytes -= self.matches.pop(match_id)[1]
+
+            self.matches[match_id] = (split_events_dict, size, version)
+            self.total_bytes += size
+            self._evict()
+
+        return split_events_dict
+
+    def get_match_event(self, match_id: int, event: MatchEvent) -> DataFrame | None:
+        match_event = self.get_split_match_events(match_id).get(event.value)
+
+        if type(match_event) is not DataFrame:
+            return None
+
+        return match_event
+
+    def get_player_event(self, match_id: int, player_name: str, selected_event: str) -> DataFrame | None:
+        return self._filter_event(match_id, "player", player_name, selected_event)
+
+    def get_team_event(self, match_id: int, team_name: str, selected_event: str) -> DataFrame | None:
+        return self._filter_event(match_id, "team", team_name, selected_event)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {"matches": len(self.matches), "bytes": self.total_bytes, "max_bytes": self.max_bytes}
+
+    @staticmethod
+    def get_frames_size(frames: Dict[str, DataFrame]) -> int:
+        return int(sum(frame.memory_usage(index=True, deep=True).sum() for frame in frames.values()))
+
+    def _filter_event(self, match_id: int, column: str, value: str, selected_event: str) -> DataFrame | None:
+        match_event = self.get_match_event(match_id, MatchEvent(selected_event))
+
+        try:
+            return match_event[match_event[column] == value]
+        except Exception as e:
+            MatchEventStore.logger.debug(f"{column.capitalize()} {value} not found in the match selected event: {selected_event}")
+            return None
+
+    def _evict(self) -> None:
+        # The newest match stays even if it alone exceeds the budget
+        while self.total_bytes > self.max_bytes and len(self.matches) > 1:
+            match_id, (_, size, _) = self.matches.popitem(last=False)
+            self.total_bytes -= size
+            MatchEventStore.logger.info(f"Evicted events of match {match_id} ({size / 1024 ** 2:.1f} MB)")
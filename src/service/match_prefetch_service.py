@@ -0,0 +1,99 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Tuple
+from pandas import DataFrame
+from repository.resilient_backend import ResilientStatsBombBackend
+from repository.statsbomb_repository import StatsBombRepository
+
+
+# Warms events and lineups of a team's matches in background threads. Results
+# of the most recent fetches are kept so the match views can join them, older
+# ones are served by the repository (and its on-disk store) again.
+class MatchPrefetchService:
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+            self,
+            statsbomb_repository: StatsBombRepository,
+            max_workers: int = 4,
+            max_results: int = 16,
+            max_prefetched: int = 4096
+        ) -> None:
+        self.statsbomb_repository = statsbomb_repository
+        self.max_results = max_results
+        self.max_prefetched = max_prefetched
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="match-prefetch")
+        self.futures: OrderedDict[Tuple[str, int, str], Future] = OrderedDict()
+        self.prefetched: OrderedDict[Tuple[str, int, str], None] = OrderedDict()
+        # Reentrant: cancelling a future under the lock runs its done callback
+        self.lock = threading.RLock()
+
+    # Keyed by the match's version too, an updated match is fetched again
+    def prefetch_matches(self, match_ids: Iterable[int]) -> None:
+        for match_id in match_ids:
+            self._prefetch(self._key("events", match_id), self.statsbomb_repository.get_split_match_events)
+            self._prefetch(self._key("lineups", match_id), self.statsbomb_repository.get_lineups)
+
+    def get_split_match_events(self, match_id: int) -> Dict[str, DataFrame]:
+        return self._get(self._key("events", match_id), self.statsbomb_repository.get_split_match_events)
+
+    def get_lineups(self, match_id: int) -> Dict[str, DataFrame]:
+        return self._get(self._key("lineups", match_id), self.statsbomb_repository.get_lineups)
+
+    def get_match_version(self, match_id: int) -> str:
+        return self.statsbomb_repository.get_match_version(match_id)
+
+    def _key(self, kind: str, match_id: int) -> Tuple[str, int, str]:
+        return kind, int(match_id), self.get_match_version(match_id)
+
+    def _prefetch(self, key: Tuple[str, int, str], fetch: Callable) -> None:
+        with self.lock:
+            # Reruns ask for the same matches again, only the first ask submits
+            if key in self.prefetched:
+                self.prefetched.move_to_end(key)
+                return
+
+            self.prefetched[key] = None
+            if len(self.prefetched) > self.max_prefetched:
+                self.prefetched.popitem(last=False)
+
+            future = self.executor.submit(self._fetch_in_background, fetch, key[1])
+            self.futures[key] = future
+            future.add_done_callback(lambda f: self._on_done(key, f))
+
+    # Prefetches fetch within the backend's background budget, sessions
+    # waiting on a fetch keep the rest of it
+    @staticmethod
+    def _fetch_in_background(fetch: Callable, match_id: int):
+        with ResilientStatsBombBackend.background():
+            return fetch(match_id)
+
+    def _get(self, key: Tuple[str, int, str], fetch: Callable):
+        with self.lock:
+            future = self.futures.get(key)
+
+            # Still queued behind other prefetches: fetch it right away instead,
+            # and let a later prefetch of the match submit it again
+            if future is not None and future.cancel():
+                self.futures.pop(key, None)
+                self.prefetched.pop(key, None)
+                future = None
+
+        if future is None or future.exception() is not None:
+            return fetch(key[1])
+
+        return future.result()
+
+    # Each finished fetch drops the oldest finished ones past max_results, the
+    # events they hold are the MatchEventStore's to keep
+    def _on_done(self, key: Tuple[str, int, str], future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            MatchPrefetchService.logger.warning(f"Prefetch of {key[0]} for match {key[1]} failed: {future.exception()}")
+
+        with self.lock:
+            done_keys = [done_key for done_key, done in self.futures.items() if done.done()]
+
+            for done_key in done_keys[:max(0, len(done_keys) - self.max_results)]:
+                del self.futures[done_key]
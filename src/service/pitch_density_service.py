@@ -0,0 +1,57 @@
+from typing import Iterable, Tuple
+import numpy as np
+
+
+# Event densities on the StatsBomb pitch (120x80). Grids hold smoothed event
+# counts, so grids from several matches can simply be summed.
+class PitchDensityService:
+    PITCH_LENGTH = 120
+    PITCH_WIDTH = 80
+
+    @staticmethod
+    def histogram(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        grid, _, _ = np.histogram2d(
+            y,
+            x,
+            bins=[PitchDensityService.PITCH_WIDTH, PitchDensityService.PITCH_LENGTH],
+            range=[[0, PitchDensityService.PITCH_WIDTH], [0, PitchDensityService.PITCH_LENGTH]]
+        )
+        return grid
+
+    @staticmethod
+    def smooth(grid: np.ndarray, bandwidth: float = 4.0) -> np.ndarray:
+        # Separable Gaussian: blur the columns, then the rows
+        kernel_y = PitchDensityService._gaussian_matrix(grid.shape[0], bandwidth)
+        kernel_x = PitchDensityService._gaussian_matrix(grid.shape[1], bandwidth)
+        return kernel_y @ grid @ kernel_x.T
+
+    @staticmethod
+    def density(x: np.ndarray, y: np.ndarray, bandwidth: float = 4.0) -> np.ndarray:
+        return PitchDensityService.smooth(PitchDensityService.histogram(x, y), bandwidth)
+
+    @staticmethod
+    def sum_grids(grids: Iterable[np.ndarray]) -> np.ndarray:
+        total = np.zeros((PitchDensityService.PITCH_WIDTH, PitchDensityService.PITCH_LENGTH))
+        for grid in grids:
+            total += grid
+        return total
+
+    @staticmethod
+    def levels(grid: np.ndarray, thresh: float = 0.05, n_levels: int = 12) -> np.ndarray | None:
+        peak = grid.max()
+        if peak <= 0:
+            return None
+        return np.linspace(thresh * peak, peak, n_levels)
+
+    @staticmethod
+    def bin_centers() -> Tuple[np.ndarray, np.ndarray]:
+        return (
+            np.arange(PitchDensityService.PITCH_LENGTH) + 0.5,
+            np.arange(PitchDensityService.PITCH_WIDTH) + 0.5
+        )
+
+    @staticmethod
+    def _gaussian_matrix(size: int, bandwidth: float) -> np.ndarray:
+        positions = np.arange(size)
+        distances = positions[:, None] - positions[None, :]
+        return np.exp(-0.5 * (distances / bandwidth) ** 2) / (np.sqrt(2 * np.pi) * bandwidth)
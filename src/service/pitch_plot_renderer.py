@@ -0,0 +1,103 @@
+import io
+from typing import Tuple
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from mplsoccer import Pitch
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from service.pitch_density_service import PitchDensityService
+
+
+# Draws the pitch plots as PNG bytes. Each plot gets its own Figure and Agg
+# canvas instead of going through pyplot's global state, so plots can be drawn
+# from several threads or processes at once. matplotlib and mplsoccer are slow
+# to import, only the render pool workers import this module.
+class PitchPlotRenderer:
+    PITCH_STYLES = {
+        "grass": dict(pitch_type='statsbomb', pitch_color='grass', line_color='#c7d5cc', stripe=True),
+    }
+
+    @staticmethod
+    def render_team_shots(shot_events: DataFrame, density: np.ndarray, style: str) -> bytes:
+        x, y = shot_events['x'].to_numpy(), shot_events['y'].to_numpy()
+        end_x, end_y = shot_events['end_x'].to_numpy(), shot_events['end_y'].to_numpy()
+
+        pitch = Pitch(**PitchPlotRenderer.PITCH_STYLES[style])
+        fig, ax = PitchPlotRenderer.draw_pitch(pitch)
+
+        PitchPlotRenderer.plot_density(ax, density, alpha=0.7)
+
+        goal = (shot_events['shot_outcome'] == 'Goal').to_numpy()
+        blocked_or_saved = shot_events['shot_outcome'].isin(['Blocked', 'Saved']).to_numpy()
+        other = ~(goal | blocked_or_saved)
+
+        # One arrows and one scatter artist per outcome colour
+        for mask, color in [(goal, 'green'), (blocked_or_saved, 'red'), (other, 'orange')]:
+            if not mask.any():
+                continue
+            pitch.arrows(x[mask], y[mask], end_x[mask], end_y[mask], ax=ax, color=color, width=3)
+            pitch.scatter(x[mask], y[mask], ax=ax, color=color, alpha=1)
+
+        return PitchPlotRenderer.figure_to_png(fig)
+
+    @staticmethod
+    def render_player_passes(passes_events: DataFrame, density: np.ndarray, style: str) -> bytes:
+        x, y = passes_events['x'].to_numpy(), passes_events['y'].to_numpy()
+        end_x, end_y = passes_events['end_x'].to_numpy(), passes_events['end_y'].to_numpy()
+
+        pitch = Pitch(**PitchPlotRenderer.PITCH_STYLES[style])
+        fig, ax = PitchPlotRenderer.draw_pitch(pitch)
+
+        PitchPlotRenderer.plot_density(ax, density, alpha=0.5)
+
+        if 'pass_outcome' in passes_events.columns:
+            pass_outcome = passes_events['pass_outcome']
+        else:
+            pass_outcome = pd.Series(None, index=passes_events.index, dtype=object)
+
+        incomplete = pass_outcome.isin(['Incomplete', 'Unknown']).to_numpy()
+        offside = (pass_outcome == 'Pass Offside').to_numpy()
+        out = (pass_outcome == 'Out').to_numpy()
+        complete = ~(incomplete | offside | out)
+
+        # One line collection and one scatter artist per outcome colour
+        for mask, color in [(incomplete, 'red'), (offside, 'blue'), (out, 'yellow'), (complete, 'black')]:
+            if not mask.any():
+                continue
+            segments = np.stack([
+                np.column_stack([x[mask], y[mask]]),
+                np.column_stack([end_x[mask], end_y[mask]])
+            ], axis=1)
+            ax.add_collection(LineCollection(segments, colors=color))
+            ax.scatter(x[mask], y[mask], color=color)
+
+        return PitchPlotRenderer.figure_to_png(fig)
+
+    @staticmethod
+    def draw_pitch(pitch: Pitch) -> Tuple[Figure, Axes]:
+        # Same figure Pitch.draw() makes through plt.subplots
+        fig = Figure(figsize=rcParams['figure.figsize'], layout='tight')
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        pitch.draw(ax=ax)
+        return fig, ax
+
+    @staticmethod
+    def plot_density(ax: Axes, density: np.ndarray, alpha: float) -> None:
+        levels = PitchDensityService.levels(density, thresh=0.05, n_levels=12)
+
+        if levels is None:
+            return
+
+        x, y = PitchDensityService.bin_centers()
+        ax.contourf(x, y, density, levels=levels, cmap='gnuplot', alpha=alpha, extend='max')
+
+    @staticmethod
+    def figure_to_png(fig: Figure) -> bytes:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+        return buffer.getvalue()
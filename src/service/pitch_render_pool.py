@@ -0,0 +1,114 @@
+import logging
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Hashable, Tuple
+import numpy as np
+from pandas import DataFrame
+
+
+# Worker side. The renderer, with matplotlib and mplsoccer, is only imported
+# in the worker processes, never in the Streamlit server.
+def init_worker() -> None:
+    import service.pitch_plot_renderer  # noqa: F401
+
+
+def render_team_shots(shot_events: DataFrame, density: np.ndarray, style: str) -> bytes:
+    from service.pitch_plot_renderer import PitchPlotRenderer
+    return PitchPlotRenderer.render_team_shots(shot_events, density, style)
+
+
+def render_player_passes(passes_events: DataFrame, density: np.ndarray, style: str) -> bytes:
+    from service.pitch_plot_renderer import PitchPlotRenderer
+    return PitchPlotRenderer.render_player_passes(passes_events, density, style)
+
+
+# Draws the pitch plots in a pool of worker processes, so sessions render in
+# parallel on every core instead of taking turns on the GIL inside the script
+# threads. Futures of the most recent plots are kept: a rerun asking for the
+# same plot joins the pending render or reads the finished image.
+class PitchRenderPool:
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, max_workers: int = 2, max_results: int = 256, render_timeout: float = 30.0) -> None:
+        self.max_workers = max_workers
+        self.max_results = max_results
+        # How long a session waits for a plot before showing a placeholder
+        self.render_timeout = render_timeout
+        self.executor: ProcessPoolExecutor | None = None
+        self.futures: OrderedDict[Hashable, Future] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, key: Hashable, render: Callable[..., bytes], build_args: Callable[[], Tuple]) -> Future:
+        with self.lock:
+            future = self._get_future(key)
+            if future is not None:
+                return future
+
+        # The plot data is only gathered when the plot has to be drawn
+        args = build_args()
+
+        with self.lock:
+            future = self._get_future(key)
+            if future is not None:
+                return future
+
+            try:
+                future = self._get_executor().submit(render, *args)
+            except BrokenProcessPool:
+                # A worker died, the pool refuses any further work
+                PitchRenderPool.logger.warning("Render pool broken, starting a new one")
+                self.executor = None
+                future = self._get_executor().submit(render, *args)
+
+            future.add_done_callback(lambda f: self._log_failure(key, f))
+            self.futures[key] = future
+
+            while len(self.futures) > self.max_results:
+                self.futures.popitem(last=False)
+
+            return future
+
+    # Given up on by a session, the next rerun submits the plot again instead
+    # of joining a render that may never finish
+    def discard(self, future: Future) -> None:
+        with self.lock:
+            for key in [key for key, pending in self.futures.items() if pending is future]:
+                del self.futures[key]
+        future.cancel()
+
+    def shutdown(self) -> None:
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+    # Failed renders are dropped, the next rerun tries again
+    def _get_future(self, key: Hashable) -> Future | None:
+        future = self.futures.get(key)
+        if future is None:
+            return None
+
+        if future.done() and (future.cancelled() or future.exception() is not None):
+            del self.futures[key]
+            return None
+
+        self.futures.move_to_end(key)
+        return future
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Started on the first plot, pages without pitch plots never spawn it.
+        # Spawned rather than forked, the server process runs many threads.
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker
+            )
+        return self.executor
+
+    def _log_failure(self, key: Hashable, future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            PitchRenderPool.logger.warning(f"Rendering {key} failed: {future.exception()}")
@@ -6,6 +6,7 @@ class SessionStateService:
     def __init__(self, states_prefix: str) -> None:
         self.states_prefix = states_prefix
         self.prefixed_view_menu_option = f'{self.states_prefix}_view_menu_option'
+        self.prefixed_page_rendering = f'{self.states_prefix}_page_rendering'
         
     def set_view_menu_option(self, menu_option: str) -> None:
         print(f"menu_option: {self.prefixed_view_menu_option}")
@@ -21,4 +22,11 @@ class SessionStateService:
         return st.session_state[self.prefixed_view_menu_option]
 
     def is_view_menu_option(self) -> bool:
-        return self.prefixed_view_menu_option in st.session_state
\ No newline at end of file
+        return self.prefixed_view_menu_option in st.session_state
+
+    # True while the whole page runs, False during a fragment rerun
+    def set_page_rendering(self, page_rendering: bool) -> None:
+        st.session_state[self.prefixed_page_rendering] = page_rendering
+
+    def is_page_rendering(self) -> bool:
+        return st.session_state.get(self.prefixed_page_rendering, False)
@@ -0,0 +1,66 @@
+import logging
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+from enums.statsbomb_view_menu_option import StatsBombViewMenuOption
+from enums.view_strategy import ViewStrategy
+
+APP_PATH = str(Path(__file__).parent.parent / "app.py")
+PROJECT_DIR = Path(__file__).parent.parent.parent
+
+
+# Runs the app headless on a small synthetic backend, starting from a cold
+# container like the first page load of a new server process. A render error
+# shows up as an exception element or as the error dialogs' elements.
+class AppSmokeTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Makes the app's basicConfig a no-op, its logs don't end up in the project's app.log
+        logging.basicConfig(level=logging.WARNING)
+
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.environ = dict(os.environ)
+        os.environ.update({
+            "STATSBOMB_BACKEND": "synthetic",
+            "STATSBOMB_SYNTHETIC_MATCHES": "200",
+            "STATSBOMB_SYNTHETIC_EVENTS_PER_MATCH": "100",
+            "STATSBOMB_CACHE_DIR": self.cache_dir.name,
+        })
+        self.cwd = os.getcwd()
+        # The app loads its images relative to the project directory
+        os.chdir(PROJECT_DIR)
+        st.cache_resource.clear()
+        st.cache_data.clear()
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        os.environ.clear()
+        os.environ.update(self.environ)
+        self.cache_dir.cleanup()
+
+    def run_app(self, app: AppTest) -> None:
+        app.run()
+        failures = [e.message for e in app.exception] + [e.value for e in app.error]
+        # The "Data unavailable" dialog is a warning, the libraries' deprecation notices too
+        failures += [w.value for w in app.warning if "StatsBomb" in w.value]
+        self.assertEqual(failures, [])
+
+    def test_home_page(self) -> None:
+        self.run_app(AppTest.from_file(APP_PATH, default_timeout=120))
+
+    def test_team_page(self) -> None:
+        app = AppTest.from_file(APP_PATH, default_timeout=120)
+        # AppTest doesn't send the custom option menus' values back
+        app.session_state["sidebar_menu"] = ViewStrategy.WORLD_CUPS.value
+        app.session_state["World Cup_view_menu"] = StatsBombViewMenuOption.TEAM.value
+        self.run_app(app)
+        self.assertTrue(any(selectbox.label == "Team Name" for selectbox in app.selectbox))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+from service.pitch_density_service import PitchDensityService
+
+
+class PitchDensityServiceTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.matches = [
+            (rng.uniform(0, 120, 300), rng.uniform(0, 80, 300)),
+            (rng.uniform(0, 120, 150), rng.uniform(0, 80, 150)),
+            (rng.uniform(0, 120, 50), rng.uniform(0, 80, 50)),
+        ]
+
+    def test_histogram_counts_events_on_the_pitch(self) -> None:
+        x, y = self.matches[0]
+        grid = PitchDensityService.histogram(x, y)
+        self.assertEqual(grid.shape, (PitchDensityService.PITCH_WIDTH, PitchDensityService.PITCH_LENGTH))
+        self.assertEqual(grid.sum(), len(x))
+
+    # A season heatmap is the sum of the matches' cached grids, it must match
+    # the density of all the season's events at once
+    def test_sum_grids_matches_the_density_of_all_events(self) -> None:
+        season = PitchDensityService.sum_grids(PitchDensityService.density(x, y) for x, y in self.matches)
+        x = np.concatenate([x for x, _ in self.matches])
+        y = np.concatenate([y for _, y in self.matches])
+        np.testing.assert_allclose(season, PitchDensityService.density(x, y))
+
+    def test_sum_grids_of_no_matches_is_empty(self) -> None:
+        season = PitchDensityService.sum_grids([])
+        self.assertEqual(season.shape, (PitchDensityService.PITCH_WIDTH, PitchDensityService.PITCH_LENGTH))
+        self.assertIsNone(PitchDensityService.levels(season))
+
+
+if __name__ == "__main__":
+    unittest.main()
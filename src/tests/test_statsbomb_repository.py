@@ -0,0 +1,31 @@
+import unittest
+from pandas import DataFrame
+from repository.statsbomb_repository import StatsBombRepository
+from repository.synthetic_open_data_backend import SyntheticOpenDataBackend
+
+
+class StatsBombRepositoryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.repository = StatsBombRepository(SyntheticOpenDataBackend(n_matches=10, events_per_match=10))
+
+    def test_event_count_matrix_counts_events_per_player(self) -> None:
+        matrix = self.repository.get_event_count_matrix(
+            {
+                "passes": DataFrame({"player": ["Messi", "Di María", "Messi"]}),
+                "shots": DataFrame({"player": ["Messi"]}),
+            },
+            "player"
+        )
+        self.assertEqual(matrix.loc["Messi"].to_dict(), {"passes": 2, "shots": 1})
+        self.assertEqual(matrix.loc["Di María"].to_dict(), {"passes": 1, "shots": 0})
+
+    def test_event_count_matrix_without_actors_is_empty(self) -> None:
+        matrix = self.repository.get_event_count_matrix({"passes": DataFrame({"team": ["Argentina"]})}, "player")
+        self.assertTrue(matrix.empty)
+        self.assertEqual((matrix.index.name, matrix.columns.name), ("player", "event"))
+        self.assertEqual(self.repository.get_player_events_info("Messi", matrix)["total_passes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
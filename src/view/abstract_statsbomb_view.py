@@ -1,23 +1,27 @@
 from abc import abstractmethod
+from concurrent.futures import Future, TimeoutError
 from enum import Enum
-import json
 import logging
 import time
-from typing import List, Tuple, Dict 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from mplsoccer import Pitch
-import seaborn as sns
+from typing import Iterator, List, Literal, Tuple, Dict 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
-import plotly.express as px
 from components.selectboxes import SelectBoxes
 from enums.match_event import MatchEvent
 from enums.player_event import PlayerEvent
+from monitoring.render_tracer import RenderTracer
+from repository.match_index import MatchIndex
 from repository.statsbomb_repository import StatsBombRepository
+from service.export_service import ExportService
+from service.match_event_store import MatchEventStore
+from service.match_prefetch_service import MatchPrefetchService
+from service.pitch_density_service import PitchDensityService
+from service.pitch_render_pool import PitchRenderPool, render_player_passes, render_team_shots
 from service.session_state_service import SessionStateService
 from view.abstract_streamlit_view import AbstractStreamlitView
 from view.abstract_view_strategy import AbstractViewStrategy, ViewStrategy
+from view.error_boundary import ErrorBoundary
 from enums.statsbomb_view_menu_option import StatsBombViewMenuOption
 import streamlit as st
 from streamlit_option_menu import option_menu
@@ -26,14 +30,21 @@ from streamlit_extras.add_vertical_space import add_vertical_space
 
 class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
     logger = logging.getLogger(__name__)
-
+    
     def __init__(
             self,
             statsbomb_repository: StatsBombRepository,
-            session_state_service: SessionStateService
+            session_state_service: SessionStateService,
+            match_prefetch_service: MatchPrefetchService,
+            match_event_store: MatchEventStore,
+            pitch_render_pool: PitchRenderPool
         ) -> None:
         self.statsbomb_repository = statsbomb_repository
         self.session_state_service = session_state_service
+        self.match_prefetch_service = match_prefetch_service
+        self.match_event_store = match_event_store
+        self.pitch_render_pool = pitch_render_pool
+        self.pitch_style = "grass"
 
     @abstractmethod
     def get_competitions_list(self) -> List[str]:
@@ -52,26 +63,46 @@ class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
         
         add_vertical_space(1)
         
-        menu_option = self.option_menu_fragment()
-        competitions = self.get_cached_competitions(self.get_competitions_list())
-        competition_name, season_name, competition = SelectBoxes.select_competition_and_season(competitions)
-        matches = self.get_cached_matches(competition_name, season_name, competition)
+        self.session_state_service.set_page_rendering(True)
+        try:
+            self.render_page()
+        finally:
+            self.session_state_service.set_page_rendering(False)
+    
+    def render_page(self) -> None:
+        self.option_menu_fragment()
+        menu_option = StatsBombViewMenuOption(self.session_state_service.get_view_menu_option())
+        catalog = self.statsbomb_repository.get_catalog()
+        competition_name, season_name = SelectBoxes.select_competition_and_season(catalog, self.get_competitions_list())
+        competition_id, season_id = catalog.get_season_ids(competition_name, season_name)
+        season_version = self.statsbomb_repository.get_season_version(competition_id, season_id)
+        matches = self.get_cached_matches(competition_id, season_id, season_version)
         team_name = SelectBoxes.team_select(matches)
-        team_matches = self.get_cached_team_matches(matches, team_name)
+        team_matches = self.get_cached_team_matches(competition_id, season_id, season_version, team_name)
+        
+        self.match_prefetch_service.prefetch_matches(team_matches["match_id"])
         
         AbstractStatsBombView.logger.info(f"Menu option selected: {menu_option}")
         
         if menu_option == StatsBombViewMenuOption.TEAM:
-            self.team_fragment(team_name, competition_name, team_matches)
+            teams_info = self.get_cached_season_teams_info(competition_id, season_id, season_version)
+            self.team_fragment(team_name, competition_name, team_matches, teams_info, competition_id, season_id)
         elif menu_option == StatsBombViewMenuOption.MATCH:
-            self.match_fragment(team_matches)
+            self.match_fragment(team_matches, self.statsbomb_repository.get_match_index(competition_id, season_id))
         elif menu_option == StatsBombViewMenuOption.PLAYER:
-            self.player_fragment(team_name, team_matches) 
+            self.player_fragment(team_name, team_matches, self.statsbomb_repository.get_match_index(competition_id, season_id))
 
-    def option_menu_fragment(self) -> StatsBombViewMenuOption:
+    # Clicking the menu only reruns this fragment, the page below depends on
+    # the option so a change escalates to a full rerun
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
+    def option_menu_fragment(self) -> None:
         menu_index = 0
+        previous_option = None
         if self.session_state_service.is_view_menu_option():
-            menu_index = StatsBombViewMenuOption.to_value_list().index(self.session_state_service.get_view_menu_option())
+            previous_option = self.session_state_service.get_view_menu_option()
+            menu_index = StatsBombViewMenuOption.to_value_list().index(previous_option)
 
         menu_option = option_menu(
             None, 
@@ -84,31 +115,64 @@ class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
         )
         
         self.session_state_service.set_view_menu_option(menu_option)
-        return StatsBombViewMenuOption(menu_option)
+        
+        if menu_option != previous_option and not self.session_state_service.is_page_rendering():
+            st.rerun()
 
-    def team_fragment(self, team_name: str, competition_name: str, team_matches: DataFrame) -> None:
-        team_info = self.statsbomb_repository.get_team_matches_info(team_name, team_matches)
+    @RenderTracer.traced(level=logging.INFO)
+    def team_fragment(
+            self,
+            team_name: str,
+            competition_name: str,
+            team_matches: DataFrame,
+            teams_info: DataFrame,
+            competition_id: int,
+            season_id: int
+        ) -> None:
+        team_info = self.statsbomb_repository.get_team_info(teams_info, team_name)
                   
         self.team_plots(team_info, competition_name) 
         
         st.divider()
         
+        self.team_open_data_fragment(team_matches, teams_info, team_info, competition_id, season_id)
+    
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
+    def team_open_data_fragment(
+            self,
+            team_matches: DataFrame,
+            teams_info: DataFrame,
+            team_info: Dict,
+            competition_id: int,
+            season_id: int
+        ) -> None:
         st.markdown(f"<h3 style='text-align: center;'>Open Data</h3>", unsafe_allow_html=True)
         
         with st.expander("Matches Dataframe", expanded=False):
             st.dataframe(team_matches)
-            st.download_button("Download", team_matches.to_csv(), "team_matches.csv", "text/csv")
+            self.download_panel(team_matches, "team_matches")
+        
+        with st.expander("Season Table Dataframe", expanded=False):
+            st.dataframe(teams_info)
+            self.download_panel(teams_info, "season_table")
       
         with st.expander("Metrics Json", expanded=False):
             st.write(team_info)
-            st.download_button("Download", json.dumps(team_info, ensure_ascii=False, indent=2), "team_info.json", "application/json") 
+            self.download_panel(team_info, "team_info")
+        
+        with st.expander("Season Events Export", expanded=False):
+            st.caption("Every event of every match of the season, one file per match and event type")
+            self.season_events_download_panel(competition_id, season_id)
 
-    def match_fragment(self, team_matches: DataFrame) -> None:
+    @RenderTracer.traced(level=logging.INFO)
+    def match_fragment(self, team_matches: DataFrame, match_index: MatchIndex) -> None:
         team_match_option = SelectBoxes.match_select(team_matches)
         
-        match_info, match = self.statsbomb_repository.get_team_match_info(team_matches, team_match_option)
+        match_info, match = match_index.get_match(team_match_option)
         
-        events_dict = self.get_cached_split_match_events(match_info["match_id"])
+        events_dict = self.match_event_store.get_split_match_events(match_info["match_id"])
 
         events_info = self.statsbomb_repository.get_match_events_info(events_dict)
         
@@ -116,136 +180,249 @@ class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
         
         st.divider()
         
+        self.match_open_data_fragment(team_matches, match, match_info, events_info)
+    
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
+    def match_open_data_fragment(self, team_matches: DataFrame, match: DataFrame, match_info: Dict, events_info: Dict) -> None:
         st.markdown(f"<h3 style='text-align: center;'>Open Data</h3>", unsafe_allow_html=True)
         
         with st.expander("Events Dataframe", expanded=True):
-            selected_event = st.selectbox("Event", MatchEvent.to_value_list(), index=2)
+            self.match_events_fragment(match_info["match_id"])
         
-            event = self.get_cached_match_event(match_info["match_id"], MatchEvent(selected_event))
-            
-            if event is not None:
-                selected_columns = st.multiselect("Columns", event.columns, default=event.columns)
-                
-                st.dataframe(event[selected_columns]) 
-                st.download_button("Download", event[selected_columns].to_csv(), "match_events.csv", "text/csv")
-            else:
-                add_vertical_space(1)
-                st.warning(f"Event {selected_event} not found in the match")
+        with st.expander("Team Events Dataframe", expanded=False):
+            team_event_counts = self.get_cached_event_count_matrix(
+                match_info["match_id"],
+                self.statsbomb_repository.get_match_version(match_info["match_id"]),
+                "team"
+            )
+            st.dataframe(team_event_counts)
+            self.download_panel(team_event_counts, "team_events")
         
         with st.expander("Match Dataframe", expanded=False):
             st.dataframe(match)
-            st.download_button("Download", team_matches.to_csv(), "team_matches.csv", "text/csv") 
+            self.download_panel(team_matches, "team_matches", key="match_team_matches") 
             
         with st.expander("Match Metrics Json", expanded=False):
             st.write(match_info)
-            st.download_button("Download", json.dumps(match_info, ensure_ascii=False, indent=2), "match_info.json", "application/json")
+            self.download_panel(match_info, "match_info")
             
         with st.expander("Events Metrics Json", expanded=False):
             st.write(events_info)
-            st.download_button("Download", json.dumps(events_info, ensure_ascii=False, indent=2), "events_info.json", "application/json")
+            self.download_panel(events_info, "events_info")
+    
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
+    def match_events_fragment(self, match_id: int) -> None:
+        selected_event = st.selectbox("Event", MatchEvent.to_value_list(), index=2)
+    
+        event = self.match_event_store.get_match_event(match_id, MatchEvent(selected_event))
         
-    def player_fragment(self, team_name: str, team_matches: DataFrame) -> None:
+        if event is not None:
+            selected_columns = st.multiselect("Columns", event.columns, default=event.columns)
+            
+            st.dataframe(event[selected_columns]) 
+            self.download_panel(event[selected_columns], "match_events")
+        else:
+            add_vertical_space(1)
+            st.warning(f"Event {selected_event} not found in the match")
+        
+    @RenderTracer.traced(level=logging.INFO)
+    def player_fragment(self, team_name: str, team_matches: DataFrame, match_index: MatchIndex) -> None:
         team_match_option = SelectBoxes.match_select(team_matches)
         
-        match_info, _ = self.statsbomb_repository.get_team_match_info(team_matches, team_match_option)
+        match_info = match_index.get_match_info(match_index.get_match_id(team_match_option))
         
-        team_lineup = self.get_cached_team_lineup(match_info["match_id"], team_name)
+        match_version = self.statsbomb_repository.get_match_version(match_info["match_id"])
+        team_lineup = self.get_cached_team_lineup(match_info["match_id"], match_version, team_name)
         
         player_name = SelectBoxes.player_select(team_lineup)
         
-        match_event_dict = self.get_cached_split_match_events(match_info["match_id"])
+        player_event_counts = self.get_cached_event_count_matrix(match_info["match_id"], match_version, "player")
         
-        player_events_info = self.statsbomb_repository.get_player_events_info(player_name, match_event_dict)
+        player_events_info = self.statsbomb_repository.get_player_events_info(player_name, player_event_counts)
         
         self.player_plots(player_name, player_events_info, match_info)        
         
         st.divider()
         
+        self.player_open_data_fragment(team_lineup, match_info["match_id"], player_name, player_events_info)
+    
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
+    def player_open_data_fragment(self, team_lineup: DataFrame, match_id: int, player_name: str, player_events_info: Dict) -> None:
         st.markdown(f"<h3 style='text-align: center;'>Open Data</h3>", unsafe_allow_html=True)
         
         with st.expander("Lineup Dataframe", expanded=True):
             st.dataframe(team_lineup)
-            st.download_button("Download", team_lineup.to_csv(), "team_lineup.csv", "text/csv")
+            self.download_panel(team_lineup, "team_lineup")
         
         with st.expander("Events Dataframe", expanded=False):
-            selected_event = st.selectbox("Event", PlayerEvent.to_value_list(), index=0)
-            
-            event = self.get_cached_player_event(match_info, player_name, selected_event)
-            
-            if event is not None:
-                selected_columns = st.multiselect("Columns", event.columns, default=event.columns)
-                    
-                st.dataframe(event[selected_columns]) 
-                st.download_button("Download", event[selected_columns].to_csv(), "player_events.csv", "text/csv")
-
-            else:
-                add_vertical_space(2)
-                st.warning(f"Event {selected_event} not found for player {player_name}")
+            self.player_events_fragment(match_id, player_name)
                 
         with st.expander("Events Metrics Json", expanded=False):
             st.write(player_events_info)
-            st.download_button("Download", json.dumps(player_events_info, ensure_ascii=False, indent=2), "player_events_info.json", "application/json")
-        
-    @st.cache_data(ttl=3600, show_spinner=True)
-    def get_cached_competitions(_self, competitions_list: List[str]) -> DataFrame:
-        competitions = _self.statsbomb_repository.get_competitions()
-        return competitions[competitions['competition_name'].isin(competitions_list)]
-        
-    @st.cache_data(ttl=3600, show_spinner=True)
-    def get_cached_team_matches(_self, matches: DataFrame, team_name: str) -> DataFrame:
-        team_matches = matches[
-            (matches["home_team"] == team_name) | (matches["away_team"] == team_name)
-        ]
-        
-        team_matches["match_option"] = team_matches.apply(
-            lambda row: f"{row['match_date']}: {row['home_team']} vs {row['away_team']}",
-            axis=1
+            self.download_panel(player_events_info, "player_events_info")
+    
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
+    def player_events_fragment(self, match_id: int, player_name: str) -> None:
+        selected_event = st.selectbox("Event", PlayerEvent.to_value_list(), index=0)
+        
+        event = self.match_event_store.get_player_event(match_id, player_name, selected_event)
+        
+        if event is not None:
+            selected_columns = st.multiselect("Columns", event.columns, default=event.columns)
+                
+            st.dataframe(event[selected_columns]) 
+            self.download_panel(event[selected_columns], "player_events")
+
+        else:
+            add_vertical_space(2)
+            st.warning(f"Event {selected_event} not found for player {player_name}")
+        
+    # Exports are only serialized once asked for, a fragment keeps the clicks
+    # from rerunning the page
+    def download_panel(self, data: DataFrame | Dict, name: str, key: str | None = None) -> None:
+        key = key or name
+        
+        if isinstance(data, dict):
+            if st.button("Prepare download", key=f"{key}_prepare"):
+                st.download_button("Download", ExportService.export_json(data), f"{name}.json", "application/json", key=f"{key}_download")
+            return
+        
+        col1, col2 = st.columns([3, 1])
+        export_format = col1.selectbox("Format", list(ExportService.FORMATS), key=f"{key}_format", label_visibility="collapsed")
+        
+        if not col2.button("Prepare download", key=f"{key}_prepare"):
+            return
+        
+        try:
+            file = ExportService.export_frame(data, export_format)
+        except ValueError as e:
+            AbstractStatsBombView.logger.warning(f"Export of {name} as {export_format} failed: {e}")
+            st.warning(f"{export_format} is not available for this table, try another format")
+            return
+        
+        st.download_button(
+            "Download",
+            file,
+            ExportService.get_file_name(name, export_format),
+            ExportService.get_mime(export_format),
+            key=f"{key}_download"
         )
-        return team_matches   
+    
+    def season_events_download_panel(self, competition_id: int, season_id: int) -> None:
+        col1, col2 = st.columns([3, 1])
+        export_format = col1.selectbox("Format", list(ExportService.FORMATS), key="season_events_format", label_visibility="collapsed")
+        
+        if not col2.button("Prepare download", key="season_events_prepare"):
+            return
+        
+        with st.spinner("Exporting the season events"):
+            try:
+                file = ExportService.export_archive(self.iter_season_events(competition_id, season_id), export_format)
+            except ValueError as e:
+                AbstractStatsBombView.logger.warning(f"Season events export as {export_format} failed: {e}")
+                st.warning(f"{export_format} is not available for these events, try another format")
+                return
+        
+        # st.download_button doesn't take temporary files, the finished zip is
+        # read back once
+        with file:
+            archive = file.read()
+        
+        st.download_button(
+            "Download",
+            archive,
+            f"season_events_{competition_id}_{season_id}.zip",
+            "application/zip",
+            key="season_events_download"
+        )
+    
+    # One match in memory at a time, straight from the repository so a bulk
+    # export doesn't evict the matches the sessions are looking at
+    def iter_season_events(self, competition_id: int, season_id: int) -> Iterator[Tuple[str, DataFrame]]:
+        matches = self.statsbomb_repository.get_season_matches(competition_id, season_id)
+        
+        for match_id in matches["match_id"]:
+            for event_name, event_df in self.statsbomb_repository.get_split_match_events(int(match_id)).items():
+                yield f"{match_id}/{event_name}", event_df
+        
+    # The get_cached_* methods take the version of the season or match they
+    # read, so an update is a new key: nothing expires, unchanged data (like
+    # finished tournaments) stays cached and updated data is fetched again
+    @RenderTracer.cache_data(max_entries=1024, show_spinner=True)
+    def get_cached_team_matches(_self, competition_id: int, season_id: int, season_version: str, team_name: str) -> DataFrame:
+        match_index = _self.statsbomb_repository.get_match_index(competition_id, season_id)
+        matches = match_index.matches
+        is_team_match = (matches["home_team"] == team_name) | (matches["away_team"] == team_name)
+        
+        return matches[is_team_match].assign(match_option=match_index.match_options[is_team_match])
 
-    @st.cache_data(ttl=3600, show_spinner=True)
-    def get_cached_matches(_self, competition_name: str, season_name: str, competition: str) -> DataFrame:
-        return _self.statsbomb_repository.get_matches(competition_name, season_name, competition)
+    @RenderTracer.cache_data(max_entries=128, show_spinner=True)
+    def get_cached_matches(_self, competition_id: int, season_id: int, season_version: str) -> DataFrame:
+        return _self.statsbomb_repository.get_season_matches(competition_id, season_id)
+    
+    @RenderTracer.cache_data(max_entries=128, show_spinner=True)
+    def get_cached_season_teams_info(_self, competition_id: int, season_id: int, season_version: str) -> DataFrame:
+        matches = _self.statsbomb_repository.get_season_matches(competition_id, season_id)
+        return _self.statsbomb_repository.get_season_teams_info(matches)
     
-    @st.cache_data(ttl=3600, show_spinner=True)
-    def get_cached_team_lineup(_self, match_id: int, team_name: str) -> DataFrame:
-        return _self.statsbomb_repository.get_team_lineup(match_id, team_name)
+    @RenderTracer.cache_data(max_entries=1024, show_spinner=True)
+    def get_cached_team_lineup(_self, match_id: int, match_version: str, team_name: str) -> DataFrame:
+        return _self.match_prefetch_service.get_lineups(match_id)[team_name]
 
-    @st.cache_data(ttl=3600, show_spinner=True)
-    def get_cached_split_match_events(_self, match_id: int) -> Dict[str, DataFrame]:
-        return _self.statsbomb_repository.get_split_match_events(match_id)
+    @RenderTracer.cache_data(max_entries=512, show_spinner=True)
+    def get_cached_event_count_matrix(_self, match_id: int, match_version: str, by: Literal["player", "team"]) -> DataFrame:
+        match_events_dict = _self.match_event_store.get_split_match_events(match_id)
+        return _self.statsbomb_repository.get_event_count_matrix(match_events_dict, by)
+            
+    # Pitch plots are drawn in the render pool, which also keeps the images
+    def submit_team_shots_image(self, match_id: int, team_name: str) -> Future:
+        match_version = self.statsbomb_repository.get_match_version(match_id)
+        
+        def build_args() -> Tuple:
+            shot_events = self.match_event_store.get_team_event(match_id, team_name, MatchEvent.SHOTS.value)
+            density = self.get_cached_team_event_density(match_id, match_version, team_name, MatchEvent.SHOTS.value)
+            # Only the plotted columns are sent to the worker
+            return shot_events[["x", "y", "end_x", "end_y", "shot_outcome"]].reset_index(drop=True), density, self.pitch_style
+        
+        key = ("team_shots", match_id, match_version, team_name, self.pitch_style)
+        return self.pitch_render_pool.submit(key, render_team_shots, build_args)
     
-    @st.cache_data(ttl=3600, show_spinner=True)
-    def get_cached_match_event(_self, match_id: int, event: MatchEvent | PlayerEvent) -> DataFrame:
-        match_events_dict = _self.get_cached_split_match_events(match_id)
-        match_event = match_events_dict.get(event.value)
+    def submit_player_passes_image(self, match_id: int, player_name: str) -> Future:
+        match_version = self.statsbomb_repository.get_match_version(match_id)
         
-        if type(match_event) is not DataFrame:
-            return None
+        def build_args() -> Tuple:
+            passes_events = self.match_event_store.get_player_event(match_id, player_name, MatchEvent.PASSES.value)
+            density = self.get_cached_player_event_density(match_id, match_version, player_name, MatchEvent.PASSES.value)
+            columns = [c for c in ["x", "y", "end_x", "end_y", "pass_outcome"] if c in passes_events.columns]
+            return passes_events[columns].reset_index(drop=True), density, self.pitch_style
         
-        return match_event
+        key = ("player_passes", match_id, match_version, player_name, self.pitch_style)
+        return self.pitch_render_pool.submit(key, render_player_passes, build_args)
     
-    @st.cache_data(ttl=3600, show_spinner=True)
-    def get_cached_player_event(_self, match_info: Dict, player_name: str, selected_event: str) -> DataFrame | None:
-        match_event = _self.get_cached_match_event(match_info["match_id"], MatchEvent(selected_event))
-        
-        try:
-            return match_event[match_event["player"] == player_name]
-        except Exception as e:
-            AbstractStatsBombView.logger.debug(f"Player {player_name} not found in the match selected event: {selected_event}")
-            return None
+    @RenderTracer.cache_data(max_entries=1024, show_spinner=False)
+    def get_cached_team_event_density(_self, match_id: int, match_version: str, team_name: str, selected_event: str) -> np.ndarray:
+        team_event = _self.match_event_store.get_team_event(match_id, team_name, selected_event)
+        return PitchDensityService.density(team_event['x'].to_numpy(), team_event['y'].to_numpy())
     
-    @st.cache_data(ttl=3600, show_spinner=True)
-    def get_cached_team_event(_self, match_info: Dict, team_name: str, selected_event: str) -> DataFrame | None:
-        match_event = _self.get_cached_match_event(match_info["match_id"], MatchEvent(selected_event))
-        
-        try:
-            return match_event[match_event["team"] == team_name]
-        except Exception as e:
-            AbstractStatsBombView.logger.debug(f"Team {team_name} not found in the match selected event: {selected_event}")
-            return None
+    @RenderTracer.cache_data(max_entries=1024, show_spinner=False)
+    def get_cached_player_event_density(_self, match_id: int, match_version: str, player_name: str, selected_event: str) -> np.ndarray:
+        player_event = _self.match_event_store.get_player_event(match_id, player_name, selected_event)
+        return PitchDensityService.density(player_event['x'].to_numpy(), player_event['y'].to_numpy())
             
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
     def team_plots(self, team_info: Dict, competition_name: str) -> None:
+        import plotly.express as px
+        
         add_vertical_space(2)
         
         st.markdown(f"<h3 style='text-align: center;'>{team_info['team_name']} at {competition_name} </h3>", unsafe_allow_html=True)
@@ -344,7 +521,14 @@ class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
         col1.plotly_chart(fig_avg_goals_bar)
         col2.plotly_chart(fig_avg_goals_pie)
         
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
     def match_plots(self, match_info: Dict, events_info: Dict) -> None:
+        # Both pitch plots render in the pool while the metrics are written
+        home_shots_image = self.submit_team_shots_image(match_info["match_id"], match_info["home_team"])
+        away_shots_image = self.submit_team_shots_image(match_info["match_id"], match_info["away_team"])
+        
         add_vertical_space(2)
         
         st.markdown(f"<h3 style='text-align: center;'>{match_info['home_team']} vs {match_info['away_team']}</h3>", unsafe_allow_html=True)
@@ -388,25 +572,21 @@ class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
         
         add_vertical_space(1)
         
-        shot_events_home = self.get_cached_team_event(match_info, match_info["home_team"], 'shots').reset_index()
-        shot_events_away = self.get_cached_team_event(match_info, match_info["away_team"], 'shots').reset_index()
-        shots_coords_home = shot_events_home['location']
-        shots_coords_home = pd.DataFrame(shots_coords_home.to_list(), columns=['x', 'y'])
-        shots_coords_away = shot_events_away['location']
-        shots_coords_away = pd.DataFrame(shots_coords_away.to_list(), columns=['x', 'y'])
-        
-        add_vertical_space(1)
-        
-        self.plot_team_shots(shot_events_home, shots_coords_home)
+        self.plot_team_shots(home_shots_image)
         
         add_vertical_space(2)
         
         st.markdown(f"<h3 style='text-align: center;'>Shots by {match_info['away_team']}</h3>", unsafe_allow_html=True)
         
-        self.plot_team_shots(shot_events_away, shots_coords_away)
+        self.plot_team_shots(away_shots_image)
         
             
+    @st.fragment
+    @ErrorBoundary.guarded
+    @RenderTracer.traced(level=logging.INFO)
     def player_plots(self, player_name: str, events_info: Dict, match_info: Dict) -> None:
+        passes_image = self.submit_player_passes_image(match_info["match_id"], player_name)
+        
         add_vertical_space(2)
             
         st.markdown(f"<h3 style='text-align: center;'>{player_name}</h3>", unsafe_allow_html=True)
@@ -433,36 +613,28 @@ class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
         
         add_vertical_space(1)
         
-        passes_events = self.get_cached_player_event(match_info, player_name, 'passes').reset_index()
-        
-        self.plot_player_passes(passes_events)
-        
-    def plot_team_shots(self, shot_events: DataFrame, shots_coords: DataFrame):
-        pitch = Pitch(pitch_type='statsbomb', pitch_color='grass', line_color='#c7d5cc', stripe=True)
-        fig, ax = pitch.draw()
-        
-        kde = sns.kdeplot(
-            x=shots_coords['x'],
-            y=shots_coords['y'],
-            fill=True,
-            thresh=0.05,
-            alpha = 0.7,
-            n_levels=12,
-            cmap = 'gnuplot'
-        )
-        
-        for i in range(len(shot_events)):
-            if shot_events.shot_outcome[i]=='Goal':
-                pitch.arrows(shot_events.location[i][0], shot_events.location[i][1], shot_events.shot_end_location[i][0], shot_events.shot_end_location[i][1], ax=ax, color='green', width=3)
-                pitch.scatter(shot_events.location[i][0], shot_events.location[i][1], ax = ax, color='green', alpha=1)
-            elif shot_events.shot_outcome[i] in ['Blocked', 'Saved']:
-                pitch.arrows(shot_events.location[i][0], shot_events.location[i][1], shot_events.shot_end_location[i][0], shot_events.shot_end_location[i][1], ax=ax, color='red', width=3)
-                pitch.scatter(shot_events.location[i][0], shot_events.location[i][1], ax = ax, color='red', alpha=1)
-            else:
-                pitch.arrows(shot_events.location[i][0], shot_events.location[i][1], shot_events.shot_end_location[i][0], shot_events.shot_end_location[i][1], ax=ax, color='orange', width=3)
-                pitch.scatter(shot_events.location[i][0], shot_events.location[i][1], ax = ax, color='orange', alpha=1)
-
-        st.pyplot(fig)
+        self.plot_player_passes(passes_image)
+        
+    # A plot that fails or takes too long leaves a warning in its place, the
+    # next rerun draws it again
+    def plot_pitch_image(self, image: Future) -> None:
+        with RenderTracer.span("PitchRenderPool.wait"):
+            try:
+                image_bytes = image.result(timeout=self.pitch_render_pool.render_timeout)
+            except TimeoutError:
+                AbstractStatsBombView.logger.warning(f"Pitch plot not ready after {self.pitch_render_pool.render_timeout:.0f}s")
+                self.pitch_render_pool.discard(image)
+                st.warning("This plot is taking too long to draw, try again in a moment")
+                return
+            except Exception as e:
+                AbstractStatsBombView.logger.warning(f"Pitch plot failed: {e}")
+                st.warning("This plot could not be drawn, try again in a moment")
+                return
+        
+        st.image(image_bytes, use_column_width=True)
+    
+    def plot_team_shots(self, shots_image: Future):
+        self.plot_pitch_image(shots_image)
         
         st.markdown("""
             <style>
@@ -496,38 +668,8 @@ class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
         
         st.markdown(legend_html, unsafe_allow_html=True)
         
-    def plot_player_passes(self, passes_events):
-        coords = passes_events['location']
-        coords = pd.DataFrame(coords.to_list(), columns=['x', 'y'])
-        
-        pitch = Pitch(pitch_type='statsbomb', pitch_color='grass', line_color='#c7d5cc', stripe=True)
-        fig, ax = pitch.draw()
-
-        kde = sns.kdeplot(
-            x=coords['x'],
-            y=coords['y'],
-            fill=True,
-            thresh=0.05,
-            alpha = 0.5,
-            n_levels=12,
-            cmap = 'gnuplot'
-        )
-
-        for i in range(len(passes_events)):
-            if passes_events.pass_outcome[i]=='Incomplete' or passes_events.pass_outcome[i]=='Unknown':
-                plt.plot((passes_events.location[i][0], passes_events.pass_end_location[i][0]), (passes_events.location[i][1], passes_events.pass_end_location[i][1]), color='red')
-                plt.scatter(passes_events.location[i][0], passes_events.location[i][1], color='red')
-            elif passes_events.pass_outcome[i]=='Pass Offside':
-                plt.plot((passes_events.location[i][0], passes_events.pass_end_location[i][0]), (passes_events.location[i][1], passes_events.pass_end_location[i][1]), color='blue')
-                plt.scatter(passes_events.location[i][0], passes_events.location[i][1], color='blue')
-            elif passes_events.pass_outcome[i]=='Out':
-                plt.plot((passes_events.location[i][0], passes_events.pass_end_location[i][0]), (passes_events.location[i][1], passes_events.pass_end_location[i][1]), color='yellow')
-                plt.scatter(passes_events.location[i][0], passes_events.location[i][1], color='yellow')
-            else:
-                plt.plot((passes_events.location[i][0], passes_events.pass_end_location[i][0]), (passes_events.location[i][1], passes_events.pass_end_location[i][1]), color='black')
-                plt.scatter(passes_events.location[i][0], passes_events.location[i][1], color='black')
-        
-        st.pyplot(fig)
+    def plot_player_passes(self, passes_image: Future):
+        self.plot_pitch_image(passes_image)
         
         st.markdown("""
             <style>
@@ -562,4 +704,4 @@ class AbstractStatsBombView(AbstractStreamlitView, AbstractViewStrategy):
                 <span>Complete</span>
             </div>
         """
-        st.markdown(legend_html, unsafe_allow_html=True)
\ No newline at end of file
+        st.markdown(legend_html, unsafe_allow_html=True)
@@ -0,0 +1,48 @@
+import functools
+import logging
+from contextlib import contextmanager
+from typing import Callable, Iterator
+import streamlit as st
+from monitoring.render_tracer import RenderTracer
+from repository.resilient_backend import StatsBombUnavailableError
+
+
+# Turns errors of a render into the error dialogs instead of a traceback on the
+# page. A fragment rerun runs only the fragment, outside MainView.render, so
+# every @st.fragment is wrapped in one too.
+class ErrorBoundary:
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    @st.dialog("Error")
+    def global_error_dialog() -> None:
+        st.error(f"Something went wrong :(")
+
+    @staticmethod
+    @st.dialog("Data unavailable")
+    def unavailable_error_dialog() -> None:
+        st.warning("The StatsBomb data can't be loaded right now, try again in a moment")
+
+    # st.rerun() and st.stop() raise BaseExceptions, they go through
+    @staticmethod
+    @contextmanager
+    def boundary(name: str) -> Iterator[None]:
+        try:
+            yield
+        except StatsBombUnavailableError as e:
+            ErrorBoundary.logger.warning(f"Data unavailable rendering {name}: {e}")
+            ErrorBoundary.unavailable_error_dialog()
+        except Exception as e:
+            ErrorBoundary.logger.error(f"Error rendering {name}: {e}")
+            ErrorBoundary.global_error_dialog()
+        finally:
+            RenderTracer.flush()
+
+    @staticmethod
+    def guarded(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> None:
+            with ErrorBoundary.boundary(func.__qualname__):
+                func(*args, **kwargs)
+
+        return wrapper
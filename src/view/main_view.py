@@ -1,9 +1,10 @@
 import logging
 from typing import List
-import streamlit as st
 from enums.view_strategy import ViewStrategy
+from monitoring.render_tracer import RenderTracer
 from view.abstract_streamlit_view import AbstractStreamlitView
 from view.abstract_view_strategy import AbstractViewStrategy
+from view.error_boundary import ErrorBoundary
 
 class MainView(AbstractStreamlitView):
     logger = logging.getLogger(__name__)
@@ -16,24 +17,11 @@ class MainView(AbstractStreamlitView):
         self.sidebar_view = sidebar_view
         self.view_strategy_list = view_strategy_list
      
-    @st.dialog("Error")
-    def global_error_dialog(self) -> None:
-        st.error(f"Something went wrong :(")
-        
     def render(self) -> None:
-        try:
+        with ErrorBoundary.boundary("View"):
             self.do_render()
-        except Exception as e:
-            logging.error(f"Error rendering View: {e}")
-            self.global_error_dialog()
 
     def do_render(self):
-        st.set_page_config(
-            page_title="Soccer Analysis App",
-            page_icon="⚽",
-            layout="centered",
-        )
-        
         sidebar_option: ViewStrategy = self.sidebar_view.render()
         
         MainView.logger.info(f"Sidebar option selected: {sidebar_option}")
@@ -42,5 +30,6 @@ class MainView(AbstractStreamlitView):
         for view_strategy in self.view_strategy_list:
             if view_strategy.accept(sidebar_option):
                 MainView.logger.info(f"Rendering view strategy: {view_strategy}")
-                view_strategy.render()
+                with RenderTracer.page_span(sidebar_option.value, "MainView.do_render"):
+                    view_strategy.render()
                 break
\ No newline at end of file
@@ -1,5 +1,8 @@
 from typing import List
 from repository.statsbomb_repository import StatsBombRepository
+from service.match_event_store import MatchEventStore
+from service.match_prefetch_service import MatchPrefetchService
+from service.pitch_render_pool import PitchRenderPool
 from service.session_state_service import SessionStateService
 from view.abstract_statsbomb_view import AbstractStatsBombView
 from view.abstract_view_strategy import ViewStrategy
@@ -10,9 +13,12 @@ class NationalCompetitionsView(AbstractStatsBombView):
     def __init__(
             self,
             statsbomb_repository: StatsBombRepository,
-            session_state_service: SessionStateService
+            session_state_service: SessionStateService,
+            match_prefetch_service: MatchPrefetchService,
+            match_event_store: MatchEventStore,
+            pitch_render_pool: PitchRenderPool
         ) -> None:
-        super().__init__(statsbomb_repository, session_state_service)
+        super().__init__(statsbomb_repository, session_state_service, match_prefetch_service, match_event_store, pitch_render_pool)
         
     def get_title(self) -> str:
         return "National Competitions"
@@ -21,17 +27,4 @@ class NationalCompetitionsView(AbstractStatsBombView):
         return view_strategy == ViewStrategy.NATIONAL_COMPETITIONS
     
     def get_competitions_list(self) -> List[str]:
-        return [
-            'Bundesliga',
-            'Copa del Rey',
-            "FA Women's Super League",
-            'Indian Super League',
-            'La Liga',
-            'Liga Profesional',
-            'Ligue 1',
-            'Major League Soccer',
-            'North American League',
-            'NWSL',
-            'Premier League',
-            'Serie A'
-        ]   
\ No newline at end of file
+        return self.statsbomb_repository.get_catalog().get_competition_names(ViewStrategy.NATIONAL_COMPETITIONS)
\ No newline at end of file
@@ -31,7 +31,8 @@ class SidebarView(AbstractStreamlitView):
                     'flag',
                 ], 
                 menu_icon="cast", 
-                default_index=0
+                default_index=0,
+                key="sidebar_menu"
             )
             
             return ViewStrategy(selected)
\ No newline at end of file
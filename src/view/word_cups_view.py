@@ -1,6 +1,9 @@
 
 from typing import List
 from repository.statsbomb_repository import StatsBombRepository
+from service.match_event_store import MatchEventStore
+from service.match_prefetch_service import MatchPrefetchService
+from service.pitch_render_pool import PitchRenderPool
 from service.session_state_service import SessionStateService
 from view.abstract_statsbomb_view import AbstractStatsBombView
 from view.abstract_view_strategy import ViewStrategy
@@ -11,9 +14,12 @@ class WordCupsView(AbstractStatsBombView):
     def __init__(
             self,
             statsbomb_repository: StatsBombRepository,
-            session_state_service: SessionStateService
+            session_state_service: SessionStateService,
+            match_prefetch_service: MatchPrefetchService,
+            match_event_store: MatchEventStore,
+            pitch_render_pool: PitchRenderPool
         ) -> None:
-        super().__init__(statsbomb_repository, session_state_service)
+        super().__init__(statsbomb_repository, session_state_service, match_prefetch_service, match_event_store, pitch_render_pool)
     
     def get_title(self) -> str:
         return "World Cup"
@@ -22,8 +28,4 @@ class WordCupsView(AbstractStatsBombView):
         return view_strategy == ViewStrategy.WORLD_CUPS
     
     def get_competitions_list(self) -> List[str]:
-        return [
-            "FIFA U20 World Cup", 
-            "FIFA World Cup", 
-            "Women's World Cup"
-        ]   
\ No newline at end of file
+        return self.statsbomb_repository.get_catalog().get_competition_names(ViewStrategy.WORLD_CUPS)
\ No newline at end of file